@@ -16,6 +16,7 @@ type ProgressBar struct {
 	total int
 	width int
 	out   io.Writer
+	last  int
 	mu    sync.Mutex
 }
 
@@ -33,6 +34,8 @@ func NewProgressBar(label string, total int) *ProgressBar {
 }
 
 // Update redraws the progress bar with the provided completed count.
+// Counts lower than the last one drawn are ignored, so concurrent workers
+// may report out of order.
 func (p *ProgressBar) Update(completed int) {
 	p.mu.Lock()
 	defer p.mu.Unlock()
@@ -43,6 +46,10 @@ func (p *ProgressBar) Update(completed int) {
 	if completed > p.total {
 		completed = p.total
 	}
+	if completed < p.last {
+		return
+	}
+	p.last = completed
 
 	percent := float64(completed) / float64(p.total)
 	filled := int(percent * float64(p.width))
@@ -0,0 +1,57 @@
+package fileutil
+
+import (
+	"encoding/json"
+	"io"
+	"os"
+	"path/filepath"
+)
+
+// fileutil.go provides crash-safe file writes for state files.
+
+// WriteFileAtomic writes data to a temp file next to path and renames it into
+// place, so readers never see a partially written file.
+func WriteFileAtomic(path string, data []byte, perm os.FileMode) error {
+	return writeAtomic(path, perm, func(w io.Writer) error {
+		_, err := w.Write(data)
+		return err
+	})
+}
+
+// WriteJSONAtomic encodes v as compact JSON straight into a temp file next to
+// path and renames it into place.
+func WriteJSONAtomic(path string, v any, perm os.FileMode) error {
+	return writeAtomic(path, perm, func(w io.Writer) error {
+		return json.NewEncoder(w).Encode(v)
+	})
+}
+
+// writeAtomic runs write against a temp file in the target directory and
+// renames the result over path once it is fully written.
+func writeAtomic(path string, perm os.FileMode, write func(w io.Writer) error) error {
+	tmp, err := os.CreateTemp(filepath.Dir(path), filepath.Base(path)+".tmp-*")
+	if err != nil {
+		return err
+	}
+	tmpPath := tmp.Name()
+
+	if err := write(tmp); err != nil {
+		tmp.Close()
+		os.Remove(tmpPath)
+		return err
+	}
+	if err := tmp.Close(); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+	if err := os.Chmod(tmpPath, perm); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+
+	if err := os.Rename(tmpPath, path); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+	return nil
+}
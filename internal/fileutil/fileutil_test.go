@@ -0,0 +1,126 @@
+package fileutil
+
+import (
+	"encoding/json"
+	"errors"
+	"io"
+	"os"
+	"path/filepath"
+	"testing"
+)
+
+// fileutil_test.go verifies atomic writes replace files whole or not at all.
+
+// assertOnly checks that dir holds exactly the named entries, so no temp
+// files were left behind
+func assertOnly(t *testing.T, dir string, names ...string) {
+	t.Helper()
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		t.Fatalf("read dir: %v", err)
+	}
+	if len(entries) != len(names) {
+		t.Fatalf("dir has %d entries, want %v", len(entries), names)
+	}
+	for i, entry := range entries {
+		if entry.Name() != names[i] {
+			t.Fatalf("dir entry %q, want %v", entry.Name(), names)
+		}
+	}
+}
+
+func TestWriteFileAtomic_ReplacesFile(t *testing.T) {
+	dir := t.TempDir()
+	path := filepath.Join(dir, "state.json")
+	if err := os.WriteFile(path, []byte("old"), 0600); err != nil {
+		t.Fatalf("seed: %v", err)
+	}
+
+	if err := WriteFileAtomic(path, []byte("new"), 0644); err != nil {
+		t.Fatalf("WriteFileAtomic: %v", err)
+	}
+
+	data, err := os.ReadFile(path)
+	if err != nil || string(data) != "new" {
+		t.Fatalf("file = %q, %v; want %q", data, err, "new")
+	}
+	info, err := os.Stat(path)
+	if err != nil || info.Mode().Perm() != 0644 {
+		t.Fatalf("mode = %v, %v; want 0644", info.Mode().Perm(), err)
+	}
+	assertOnly(t, dir, "state.json")
+}
+
+func TestWriteAtomic_FailureHalfwayKeepsOldFile(t *testing.T) {
+	dir := t.TempDir()
+	path := filepath.Join(dir, "state.json")
+	if err := os.WriteFile(path, []byte("old"), 0644); err != nil {
+		t.Fatalf("seed: %v", err)
+	}
+
+	errDisk := errors.New("disk full")
+	err := writeAtomic(path, 0644, func(w io.Writer) error {
+		if _, err := w.Write([]byte(`{"partial":`)); err != nil {
+			return err
+		}
+		return errDisk
+	})
+	if !errors.Is(err, errDisk) {
+		t.Fatalf("writeAtomic error = %v, want %v", err, errDisk)
+	}
+
+	data, err := os.ReadFile(path)
+	if err != nil || string(data) != "old" {
+		t.Fatalf("file = %q, %v; want the old contents", data, err)
+	}
+	assertOnly(t, dir, "state.json")
+}
+
+func TestWriteJSONAtomic(t *testing.T) {
+	dir := t.TempDir()
+	path := filepath.Join(dir, "state.json")
+
+	want := map[string]int{"a": 1, "b": 2}
+	if err := WriteJSONAtomic(path, want, 0644); err != nil {
+		t.Fatalf("WriteJSONAtomic: %v", err)
+	}
+	data, err := os.ReadFile(path)
+	if err != nil {
+		t.Fatalf("read: %v", err)
+	}
+	var got map[string]int
+	if err := json.Unmarshal(data, &got); err != nil || len(got) != 2 || got["a"] != 1 || got["b"] != 2 {
+		t.Fatalf("decoded %v, %v; want %v", got, err, want)
+	}
+
+	// A value that cannot be encoded leaves the previous file alone
+	if err := WriteJSONAtomic(path, map[string]any{"ch": make(chan int)}, 0644); err == nil {
+		t.Fatalf("expected an encoding error")
+	}
+	after, err := os.ReadFile(path)
+	if err != nil || string(after) != string(data) {
+		t.Fatalf("file changed after a failed write: %q", after)
+	}
+	assertOnly(t, dir, "state.json")
+}
+
+func TestWriteFileAtomic_RenameFailureCleansUp(t *testing.T) {
+	dir := t.TempDir()
+	// A non-empty directory at the target path makes the rename fail
+	path := filepath.Join(dir, "state.json")
+	if err := os.MkdirAll(filepath.Join(path, "child"), 0755); err != nil {
+		t.Fatalf("mkdir: %v", err)
+	}
+
+	if err := WriteFileAtomic(path, []byte("new"), 0644); err == nil {
+		t.Fatalf("expected rename over a directory to fail")
+	}
+	assertOnly(t, dir, "state.json")
+}
+
+func TestWriteFileAtomic_MissingDirectory(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "missing", "state.json")
+	if err := WriteFileAtomic(path, []byte("new"), 0644); err == nil {
+		t.Fatalf("expected an error for a missing directory")
+	}
+}
@@ -54,7 +54,20 @@ func IsInfoEnabled() bool {
 
 // IsTTY reports whether stdout is attached to a terminal.
 func IsTTY() bool {
+	return stdoutIsTTY()
+}
+
+// stdoutIsTTY checks the terminal once; stdout doesn't change while running
+var stdoutIsTTY = sync.OnceValue(func() bool {
 	return isatty.IsTerminal(os.Stdout.Fd()) || isatty.IsCygwinTerminal(os.Stdout.Fd())
+})
+
+// toString formats a log field value, skipping fmt for the usual string case
+func toString(i interface{}) string {
+	if s, ok := i.(string); ok {
+		return s
+	}
+	return fmt.Sprintf("%v", i)
 }
 
 // GetLogPath returns the full path to the log file
@@ -64,11 +77,10 @@ func GetLogPath() string {
 	}
 	logsDir := filepath.Join(logPath, "logs")
 
-	if _, err := os.Stat(logsDir); os.IsNotExist(err) {
-		if err := os.MkdirAll(logsDir, 0755); err != nil {
-			fmt.Printf("Failed to create logs directory: %v\n", err)
-			return filepath.Join(os.TempDir(), "robofuse.log")
-		}
+	// MkdirAll is a no-op for an existing directory, no separate Stat needed
+	if err := os.MkdirAll(logsDir, 0755); err != nil {
+		fmt.Printf("Failed to create logs directory: %v\n", err)
+		return filepath.Join(os.TempDir(), "robofuse.log")
 	}
 
 	return filepath.Join(logsDir, "robofuse.log")
@@ -93,9 +105,10 @@ func New(prefix string) zerolog.Logger {
 	consoleWriter := zerolog.ConsoleWriter{
 		Out:        os.Stdout,
 		TimeFormat: "15:04:05",
-		NoColor:    false,
+		// Skip ANSI colors when output is redirected to a file or pipe
+		NoColor: !stdoutIsTTY(),
 		FormatLevel: func(i interface{}) string {
-			level := strings.ToUpper(fmt.Sprintf("%s", i))
+			level := strings.ToUpper(toString(i))
 			switch level {
 			case "DEBUG":
 				return "[DBG]"
@@ -111,9 +124,7 @@ func New(prefix string) zerolog.Logger {
 				return fmt.Sprintf("[%s]", level[:3])
 			}
 		},
-		FormatMessage: func(i interface{}) string {
-			return fmt.Sprintf("%v", i)
-		},
+		FormatMessage: toString,
 	}
 
 	fileWriter := zerolog.ConsoleWriter{
@@ -121,11 +132,9 @@ func New(prefix string) zerolog.Logger {
 		TimeFormat: "2006-01-02 15:04:05",
 		NoColor:    true,
 		FormatLevel: func(i interface{}) string {
-			return strings.ToUpper(fmt.Sprintf("| %-6s|", i))
-		},
-		FormatMessage: func(i interface{}) string {
-			return fmt.Sprintf("%v", i)
+			return strings.ToUpper(fmt.Sprintf("| %-6s|", toString(i)))
 		},
+		FormatMessage: toString,
 	}
 
 	multi := zerolog.MultiLevelWriter(consoleWriter, fileWriter)
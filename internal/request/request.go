@@ -50,6 +50,7 @@ type ClientOption func(*Client)
 type Client struct {
 	client          *http.Client
 	rateLimiter     *rate.Limiter
+	drainMu         sync.Mutex
 	headers         map[string]string
 	headersMu       sync.RWMutex
 	maxRetries      int
@@ -58,6 +59,8 @@ type Client struct {
 	retryableStatus map[int]struct{}
 	logger          zerolog.Logger
 	proxy           string
+	maxIdlePerHost  int
+	http2           bool
 }
 
 // WithMaxRetries sets the maximum number of retry attempts
@@ -114,6 +117,33 @@ func WithProxy(proxyURL string) ClientOption {
 	}
 }
 
+// WithMaxIdleConnsPerHost sets how many keep-alive connections are kept per host
+func WithMaxIdleConnsPerHost(n int) ClientOption {
+	return func(c *Client) {
+		c.maxIdlePerHost = n
+	}
+}
+
+// WithHTTP2 lets the client negotiate HTTP/2, so concurrent requests to a host
+// are multiplexed over one TLS connection instead of one connection each
+func WithHTTP2(enabled bool) ClientOption {
+	return func(c *Client) {
+		c.http2 = enabled
+	}
+}
+
+// WithTransport makes the client use an existing transport and its connection pool
+func WithTransport(transport http.RoundTripper) ClientOption {
+	return func(c *Client) {
+		c.client.Transport = transport
+	}
+}
+
+// Transport returns the underlying transport so other clients can share its connection pool
+func (c *Client) Transport() http.RoundTripper {
+	return c.client.Transport
+}
+
 // SetHeader sets a header value
 func (c *Client) SetHeader(key, value string) {
 	c.headersMu.Lock()
@@ -121,11 +151,13 @@ func (c *Client) SetHeader(key, value string) {
 	c.headersMu.Unlock()
 }
 
+// maxRateLimitJitter caps the random delay added when a request has to wait for a token
+const maxRateLimitJitter = 50 * time.Millisecond
+
 // doRequest performs a single HTTP request with rate limiting
 func (c *Client) doRequest(req *http.Request) (*http.Response, error) {
 	if c.rateLimiter != nil {
-		err := c.rateLimiter.Wait(req.Context())
-		if err != nil {
+		if err := c.waitForToken(req.Context()); err != nil {
 			return nil, fmt.Errorf("rate limiter wait: %w", err)
 		}
 	}
@@ -133,6 +165,47 @@ func (c *Client) doRequest(req *http.Request) (*http.Response, error) {
 	return c.client.Do(req)
 }
 
+// waitForToken takes a token from the rate limiter bucket. Requests proceed
+// immediately while the bucket has tokens; once it is empty the wait gets a
+// small jitter so queued workers don't all wake up on the same tick.
+func (c *Client) waitForToken(ctx context.Context) error {
+	reservation := c.rateLimiter.Reserve()
+	if !reservation.OK() {
+		return fmt.Errorf("rate limiter burst too small")
+	}
+
+	delay := reservation.Delay()
+	if delay == 0 {
+		return nil
+	}
+	delay += time.Duration(rand.Int63n(int64(maxRateLimitJitter)))
+
+	timer := time.NewTimer(delay)
+	defer timer.Stop()
+
+	select {
+	case <-ctx.Done():
+		reservation.Cancel()
+		return ctx.Err()
+	case <-timer.C:
+		return nil
+	}
+}
+
+// drainRateLimiter consumes the tokens currently in the rate limiter. Taking
+// only what is there, rather than a full burst, keeps 429s that arrive
+// together from stacking their delays.
+func (c *Client) drainRateLimiter() {
+	if c.rateLimiter == nil {
+		return
+	}
+	c.drainMu.Lock()
+	defer c.drainMu.Unlock()
+	if n := int(c.rateLimiter.Tokens()); n > 0 {
+		c.rateLimiter.ReserveN(time.Now(), n)
+	}
+}
+
 // Do performs an HTTP request with retries for certain status codes
 func (c *Client) Do(req *http.Request) (*http.Response, error) {
 	var bodyBytes []byte
@@ -146,6 +219,13 @@ func (c *Client) Do(req *http.Request) (*http.Response, error) {
 		req.Body.Close()
 	}
 
+	// Headers stay on req across attempts, so apply them once
+	c.headersMu.RLock()
+	for key, value := range c.headers {
+		req.Header.Set(key, value)
+	}
+	c.headersMu.RUnlock()
+
 	backoff := time.Millisecond * 500
 	var resp *http.Response
 
@@ -154,14 +234,6 @@ func (c *Client) Do(req *http.Request) (*http.Response, error) {
 			req.Body = io.NopCloser(bytes.NewReader(bodyBytes))
 		}
 
-		c.headersMu.RLock()
-		if c.headers != nil {
-			for key, value := range c.headers {
-				req.Header.Set(key, value)
-			}
-		}
-		c.headersMu.RUnlock()
-
 		resp, err = c.doRequest(req)
 		if err != nil {
 			if isRetryableError(err) && attempt < c.maxRetries {
@@ -184,10 +256,20 @@ func (c *Client) Do(req *http.Request) (*http.Response, error) {
 			return resp, nil
 		}
 
-		resp.Body.Close()
+		// A 429 means the shared bucket is ahead of the server's limit; empty
+		// it so every worker using this client slows down, not just the one
+		// that got rejected
+		if resp.StatusCode == http.StatusTooManyRequests {
+			c.drainRateLimiter()
+		}
 
-		jitter := time.Duration(rand.Int63n(int64(backoff / 4)))
-		sleepTime := backoff + jitter
+		// Prefer the server's Retry-After hint over our own backoff guess
+		sleepTime, ok := retryAfter(resp)
+		if !ok {
+			jitter := time.Duration(rand.Int63n(int64(backoff / 4)))
+			sleepTime = backoff + jitter
+		}
+		resp.Body.Close()
 
 		select {
 		case <-req.Context().Done():
@@ -201,6 +283,34 @@ func (c *Client) Do(req *http.Request) (*http.Response, error) {
 	return nil, fmt.Errorf("max retries exceeded")
 }
 
+// maxRetryAfter caps how long a Retry-After header can stall a single retry
+const maxRetryAfter = 60 * time.Second
+
+// retryAfter parses the Retry-After header, given either in seconds or as an HTTP date
+func retryAfter(resp *http.Response) (time.Duration, bool) {
+	value := resp.Header.Get("Retry-After")
+	if value == "" {
+		return 0, false
+	}
+
+	var wait time.Duration
+	if seconds, err := strconv.Atoi(value); err == nil {
+		wait = time.Duration(seconds) * time.Second
+	} else if at, err := http.ParseTime(value); err == nil {
+		wait = time.Until(at)
+	} else {
+		return 0, false
+	}
+
+	if wait < 0 {
+		wait = 0
+	}
+	if wait > maxRetryAfter {
+		wait = maxRetryAfter
+	}
+	return wait, true
+}
+
 // MakeRequest performs an HTTP request and returns the response body as bytes
 func (c *Client) MakeRequest(req *http.Request) ([]byte, error) {
 	res, err := c.Do(req)
@@ -248,10 +358,11 @@ func New(options ...ClientOption) *Client {
 			http.StatusServiceUnavailable:  {},
 			http.StatusGatewayTimeout:      {},
 		},
-		logger:  logger.New("request"),
-		timeout: 60 * time.Second,
-		proxy:   "",
-		headers: make(map[string]string),
+		logger:         logger.New("request"),
+		timeout:        60 * time.Second,
+		proxy:          "",
+		headers:        make(map[string]string),
+		maxIdlePerHost: 32,
 	}
 
 	client.client = &http.Client{
@@ -267,8 +378,18 @@ func New(options ...ClientOption) *Client {
 			TLSClientConfig: &tls.Config{
 				InsecureSkipVerify: client.skipTLSVerify,
 			},
-			DisableKeepAlives: false,
-			TLSNextProto:      make(map[string]func(authority string, c *tls.Conn) http.RoundTripper),
+			DisableKeepAlives:   false,
+			MaxIdleConns:        client.maxIdlePerHost * 2,
+			MaxIdleConnsPerHost: client.maxIdlePerHost,
+			IdleConnTimeout:     90 * time.Second,
+		}
+
+		if client.http2 {
+			// Needed because the transport has a custom TLS config and dialer
+			transport.ForceAttemptHTTP2 = true
+		} else {
+			// A non-nil empty map disables HTTP/2
+			transport.TLSNextProto = make(map[string]func(authority string, c *tls.Conn) http.RoundTripper)
 		}
 
 		if client.proxy != "" {
@@ -305,6 +426,15 @@ func New(options ...ClientOption) *Client {
 			transport.Proxy = http.ProxyFromEnvironment
 		}
 
+		// Keep idle pooled connections alive at the TCP level; Go already
+		// disables Nagle (TCP_NODELAY) on every TCP connection it dials
+		if transport.DialContext == nil {
+			transport.DialContext = (&net.Dialer{
+				Timeout:   30 * time.Second,
+				KeepAlive: 30 * time.Second,
+			}).DialContext
+		}
+
 		client.client.Transport = transport
 	}
 
@@ -0,0 +1,143 @@
+package request
+
+import (
+	"net/http"
+	"net/http/httptest"
+	"strconv"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"golang.org/x/time/rate"
+)
+
+// request_test.go verifies Retry-After and rate limiter handling on retryable responses.
+
+func TestRetryAfter(t *testing.T) {
+	now := time.Now()
+	cases := []struct {
+		name   string
+		header string
+		want   time.Duration
+		ok     bool
+		approx bool // HTTP dates are relative to now and have second precision
+	}{
+		{name: "missing", header: "", ok: false},
+		{name: "seconds", header: "5", want: 5 * time.Second, ok: true},
+		{name: "zero seconds", header: "0", want: 0, ok: true},
+		{name: "negative seconds", header: "-3", want: 0, ok: true},
+		{name: "seconds over cap", header: "3600", want: maxRetryAfter, ok: true},
+		{name: "http date", header: now.Add(30 * time.Second).UTC().Format(http.TimeFormat), want: 30 * time.Second, ok: true, approx: true},
+		{name: "http date in the past", header: now.Add(-time.Hour).UTC().Format(http.TimeFormat), want: 0, ok: true},
+		{name: "http date over cap", header: now.Add(time.Hour).UTC().Format(http.TimeFormat), want: maxRetryAfter, ok: true},
+		{name: "garbage", header: "soon", ok: false},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.name, func(t *testing.T) {
+			resp := &http.Response{Header: http.Header{}}
+			if tc.header != "" {
+				resp.Header.Set("Retry-After", tc.header)
+			}
+
+			got, ok := retryAfter(resp)
+			if ok != tc.ok {
+				t.Fatalf("retryAfter(%q) ok = %v, want %v", tc.header, ok, tc.ok)
+			}
+			if tc.approx {
+				if diff := got - tc.want; diff < -2*time.Second || diff > time.Second {
+					t.Fatalf("retryAfter(%q) = %v, want about %v", tc.header, got, tc.want)
+				}
+				return
+			}
+			if got != tc.want {
+				t.Fatalf("retryAfter(%q) = %v, want %v", tc.header, got, tc.want)
+			}
+		})
+	}
+}
+
+func TestDo_HonorsRetryAfterOverBackoff(t *testing.T) {
+	var hits atomic.Int32
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if hits.Add(1) == 1 {
+			// A zero hint replaces the 500ms first backoff
+			w.Header().Set("Retry-After", "0")
+			w.WriteHeader(http.StatusServiceUnavailable)
+			return
+		}
+		w.WriteHeader(http.StatusOK)
+	}))
+	defer srv.Close()
+
+	client := New(WithMaxRetries(2), WithRetryableStatus(http.StatusServiceUnavailable))
+	req, _ := http.NewRequest(http.MethodGet, srv.URL, nil)
+
+	start := time.Now()
+	resp, err := client.Do(req)
+	if err != nil {
+		t.Fatalf("Do: %v", err)
+	}
+	resp.Body.Close()
+
+	if resp.StatusCode != http.StatusOK {
+		t.Fatalf("status = %d, want 200 after retry", resp.StatusCode)
+	}
+	if got := hits.Load(); got != 2 {
+		t.Fatalf("server hit %d times, want 2", got)
+	}
+	if elapsed := time.Since(start); elapsed >= 400*time.Millisecond {
+		t.Fatalf("retry took %v; Retry-After: 0 should skip the backoff", elapsed)
+	}
+}
+
+func TestDo_ConcurrentTooManyRequestsDoNotStackDelays(t *testing.T) {
+	const workers = 10
+
+	// Each path is rejected once, then served
+	var seen sync.Map
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if _, loaded := seen.LoadOrStore(r.URL.Path, true); !loaded {
+			w.Header().Set("Retry-After", "0")
+			w.WriteHeader(http.StatusTooManyRequests)
+			return
+		}
+		w.WriteHeader(http.StatusOK)
+	}))
+	defer srv.Close()
+
+	// 2*workers requests at 50/s with a burst of 5 need about 300ms. Had each
+	// 429 reserved a full burst, the wave would add workers*5 tokens (1s).
+	limiter := rate.NewLimiter(rate.Limit(50), 5)
+	client := New(
+		WithMaxRetries(1),
+		WithRetryableStatus(http.StatusTooManyRequests),
+		WithRateLimiter(limiter),
+	)
+
+	start := time.Now()
+	var wg sync.WaitGroup
+	for i := 0; i < workers; i++ {
+		i := i // capture
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			req, _ := http.NewRequest(http.MethodGet, srv.URL+"/"+strconv.Itoa(i), nil)
+			resp, err := client.Do(req)
+			if err != nil {
+				t.Errorf("Do: %v", err)
+				return
+			}
+			resp.Body.Close()
+			if resp.StatusCode != http.StatusOK {
+				t.Errorf("status = %d, want 200 after retry", resp.StatusCode)
+			}
+		}()
+	}
+	wg.Wait()
+
+	if elapsed := time.Since(start); elapsed >= 800*time.Millisecond {
+		t.Fatalf("%d concurrent 429s took %v; drains should not stack", workers, elapsed)
+	}
+}
@@ -0,0 +1,100 @@
+package organizer
+
+import (
+	"io/fs"
+	"os"
+	"path/filepath"
+	"strings"
+)
+
+// files.go lists the library and organized trees for existence checks.
+
+// fileSet answers whether a file exists under root from a single walk. Parts
+// of the tree the walk could not list (unreadable or symlinked folders) are
+// checked with os.Stat instead, so they never look empty.
+type fileSet struct {
+	root  string
+	files map[string]struct{}
+	// partial holds folders, relative to root, whose contents were not listed
+	partial []string
+	// statAll is set when root itself could not be listed
+	statAll bool
+}
+
+// listFiles walks root once. A missing root yields an empty set; other walk
+// errors are logged and the affected folders fall back to os.Stat.
+func (o *Organizer) listFiles(root string) *fileSet {
+	set := &fileSet{root: root, files: make(map[string]struct{})}
+
+	// The trailing separator makes the walk follow a symlinked root
+	filepath.WalkDir(root+string(filepath.Separator), func(path string, d fs.DirEntry, err error) error {
+		if err != nil {
+			if d == nil {
+				// root could not be read at all
+				if !os.IsNotExist(err) {
+					o.logger.Warn().Err(err).Str("path", root).Msg("Failed to list folder, checking files one by one")
+					set.statAll = true
+				}
+				return nil
+			}
+			o.logger.Warn().Err(err).Str("path", path).Msg("Failed to list folder, checking files one by one")
+			set.addPartial(path)
+			return nil
+		}
+		if d.IsDir() {
+			return nil
+		}
+
+		// Follow symlinks like os.Stat: dangling links are missing files and
+		// linked folders, which the walk does not enter, are checked on demand
+		if d.Type()&fs.ModeSymlink != 0 {
+			info, err := os.Stat(path)
+			if err != nil {
+				return nil
+			}
+			if info.IsDir() {
+				set.addPartial(path)
+				return nil
+			}
+		}
+
+		if rel, err := filepath.Rel(root, path); err == nil {
+			set.files[rel] = struct{}{}
+		}
+		return nil
+	})
+	return set
+}
+
+// addPartial records a folder whose contents must be checked with os.Stat
+func (s *fileSet) addPartial(path string) {
+	rel, err := filepath.Rel(s.root, path)
+	if err != nil || rel == "." {
+		s.statAll = true
+		return
+	}
+	s.partial = append(s.partial, rel)
+}
+
+// exists reports whether relPath names an existing file under root
+func (s *fileSet) exists(relPath string) bool {
+	relPath = filepath.Clean(relPath)
+	if _, ok := s.files[relPath]; ok {
+		return true
+	}
+	if !s.statAll && !s.inPartial(relPath) {
+		return false
+	}
+	_, err := os.Stat(filepath.Join(s.root, relPath))
+	return err == nil
+}
+
+// inPartial reports whether relPath is, or is under, a folder that was not listed
+func (s *fileSet) inPartial(relPath string) bool {
+	for _, dir := range s.partial {
+		if relPath == dir || strings.HasPrefix(relPath, dir+string(filepath.Separator)) {
+			return true
+		}
+	}
+	return false
+}
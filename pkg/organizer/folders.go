@@ -0,0 +1,117 @@
+package organizer
+
+import (
+	"os"
+	"path/filepath"
+	"strings"
+	"unicode"
+)
+
+// folders.go tracks destination folders for the duration of a run.
+
+// folderListing indexes the subfolders of one base folder (Movies, Series, Anime)
+// so series folder lookups are map hits instead of scans.
+type folderListing struct {
+	seen map[string]struct{}
+	// exact maps a lowercase folder name to the folder
+	exact map[string]string
+	// titles maps the lowercase title part of a folder ("show" for "Show" and
+	// "Show (2020)") to the first folder listed with that title
+	titles map[string]string
+}
+
+// listFolders returns the index for a base folder, reading the directory only
+// on the first call of a run. A missing directory yields an empty index.
+func (o *Organizer) listFolders(baseFolder string) *folderListing {
+	if listing, ok := o.folderCache[baseFolder]; ok {
+		return listing
+	}
+
+	listing := &folderListing{
+		seen:   make(map[string]struct{}),
+		exact:  make(map[string]string),
+		titles: make(map[string]string),
+	}
+	entries, _ := os.ReadDir(filepath.Join(o.organizedDir, baseFolder))
+	for _, entry := range entries {
+		if entry.IsDir() {
+			listing.add(entry.Name())
+		}
+	}
+
+	o.folderCache[baseFolder] = listing
+	return listing
+}
+
+// add indexes a subfolder unless it is already listed. Earlier folders win
+// when several share a key, matching directory listing order.
+func (l *folderListing) add(name string) {
+	if _, ok := l.seen[name]; ok {
+		return
+	}
+	l.seen[name] = struct{}{}
+
+	lower := strings.ToLower(name)
+	if _, ok := l.exact[lower]; !ok {
+		l.exact[lower] = name
+	}
+
+	// "Title" and "Title (YYYY)" both match a lookup for "title"
+	trimmed := strings.TrimRightFunc(lower, unicode.IsSpace)
+	l.addTitle(trimmed, name)
+	if n := len(trimmed); n >= 6 && trimmed[n-6] == '(' && trimmed[n-1] == ')' {
+		l.addTitle(strings.TrimRightFunc(trimmed[:n-6], unicode.IsSpace), name)
+	}
+}
+
+// addTitle maps a title key to a folder unless an earlier folder has it
+func (l *folderListing) addTitle(key, name string) {
+	if _, ok := l.titles[key]; !ok {
+		l.titles[key] = name
+	}
+}
+
+// noteCreated keeps cached listings current after a file was placed at
+// destRelPath (<base>/<title>/...), instead of re-reading the directory.
+func (o *Organizer) noteCreated(destRelPath string) {
+	base, rest, ok := strings.Cut(destRelPath, string(filepath.Separator))
+	if !ok {
+		return
+	}
+	title, _, ok := strings.Cut(rest, string(filepath.Separator))
+	if !ok {
+		return
+	}
+	if listing, cached := o.folderCache[base]; cached {
+		listing.add(title)
+	}
+}
+
+// ensureDir creates a destination folder unless it is already known to exist
+// this run. Its parents up to the organized root are recorded as well, so a
+// sibling season folder is made with a single Mkdir instead of MkdirAll's
+// walk up the tree.
+func (o *Organizer) ensureDir(fullDir string) error {
+	o.dirsMu.Lock()
+	_, known := o.createdDirs[fullDir]
+	_, parentKnown := o.createdDirs[filepath.Dir(fullDir)]
+	o.dirsMu.Unlock()
+	if known {
+		return nil
+	}
+
+	if parentKnown {
+		if err := os.Mkdir(fullDir, 0755); err != nil && !os.IsExist(err) {
+			return err
+		}
+	} else if err := os.MkdirAll(fullDir, 0755); err != nil {
+		return err
+	}
+
+	o.dirsMu.Lock()
+	for dir := fullDir; dir != o.organizedDir && strings.HasPrefix(dir, o.organizedDir); dir = filepath.Dir(dir) {
+		o.createdDirs[dir] = struct{}{}
+	}
+	o.dirsMu.Unlock()
+	return nil
+}
@@ -5,14 +5,17 @@ package organizer
 
 import (
 	"encoding/json"
-	"fmt"
 	"io"
+	"maps"
 	"os"
 	"path/filepath"
-	"regexp"
+	"strconv"
 	"strings"
+	"sync"
 
 	ptt "github.com/itsrenoria/ptt-go"
+	"github.com/robofuse/robofuse/internal/fileutil"
+	"github.com/robofuse/robofuse/pkg/worker"
 	"github.com/rs/zerolog"
 )
 
@@ -51,9 +54,22 @@ type Organizer struct {
 	organizedDir string
 	dbPath       string
 	trackingPath string
-	parser       *ptt.Parser
 	logger       zerolog.Logger
 	db           map[string]FileEntry
+	// dbLoaded is set once db mirrors the file; each run saves what it
+	// leaves in db, so later runs don't read it back
+	dbLoaded bool
+	// dbUnsaved is set when the last save failed, so the next run retries it
+	dbUnsaved bool
+	// parseCache memoizes parser results by name; parent folder names
+	// repeat for every file of a release
+	parseCache map[string]*ptt.TorrentInfo
+	// folderCache holds destination folder listings for the current run
+	folderCache map[string]*folderListing
+	// createdDirs holds destination folders known to exist this run;
+	// copy workers share it under dirsMu
+	createdDirs map[string]struct{}
+	dirsMu      sync.Mutex
 }
 
 // Config holds organizer configuration.
@@ -66,11 +82,17 @@ type Config struct {
 	Logger       zerolog.Logger
 }
 
-// New creates a new Organizer instance.
-func New(cfg Config) *Organizer {
+// sharedParser builds the ptt parser and its handler tables once per process,
+// on the first name that actually needs parsing; every Organizer reuses it.
+// Organizers only parse from their single-threaded planning phase.
+var sharedParser = sync.OnceValue(func() *ptt.Parser {
 	parser := ptt.NewParser()
 	ptt.AddDefaults(parser)
+	return parser
+})
 
+// New creates a new Organizer instance.
+func New(cfg Config) *Organizer {
 	libraryDir := cfg.OutputDir
 	if libraryDir == "" {
 		libraryDir = filepath.Join(cfg.BaseDir, "library")
@@ -97,23 +119,43 @@ func New(cfg Config) *Organizer {
 		organizedDir: organizedDir,
 		dbPath:       filepath.Join(cacheDir, "organizer_db.json"),
 		trackingPath: trackingPath,
-		parser:       parser,
 		logger:       cfg.Logger,
 		db:           make(map[string]FileEntry),
+		parseCache:   make(map[string]*ptt.TorrentInfo),
+		folderCache:  make(map[string]*folderListing),
+		createdDirs:  make(map[string]struct{}),
 	}
 }
 
-// loadDB loads the organizer database from disk.
+// maxParseCache bounds the parse memo; it is cleared once full so memory
+// stays flat for Organizers kept across watch cycles.
+const maxParseCache = 4096
+
+// parse parses a file or folder name, reusing earlier results for the same name.
+func (o *Organizer) parse(name string) *ptt.TorrentInfo {
+	if parsed, ok := o.parseCache[name]; ok {
+		return parsed
+	}
+	if len(o.parseCache) >= maxParseCache {
+		clear(o.parseCache)
+	}
+	parsed := sharedParser().Parse(name)
+	o.parseCache[name] = parsed
+	return parsed
+}
+
+// loadDB loads the organizer database from disk, once per Organizer.
 func (o *Organizer) loadDB() error {
-	data, err := os.ReadFile(o.dbPath)
-	if os.IsNotExist(err) {
-		o.db = make(map[string]FileEntry)
+	if o.dbLoaded {
 		return nil
 	}
-	if err != nil {
+	db := make(map[string]FileEntry)
+	if err := decodeJSONFile(o.dbPath, &db); err != nil && !os.IsNotExist(err) {
 		return err
 	}
-	return json.Unmarshal(data, &o.db)
+	o.db = db
+	o.dbLoaded = true
+	return nil
 }
 
 // saveDB saves the organizer database to disk.
@@ -121,90 +163,92 @@ func (o *Organizer) saveDB() error {
 	if err := os.MkdirAll(filepath.Dir(o.dbPath), 0755); err != nil {
 		return err
 	}
-	data, err := json.MarshalIndent(o.db, "", "  ")
-	if err != nil {
-		return err
-	}
-	return os.WriteFile(o.dbPath, data, 0644)
+	return fileutil.WriteJSONAtomic(o.dbPath, o.db, 0644)
 }
 
 // loadTracking loads the file tracking database.
 func (o *Organizer) loadTracking() (map[string]TrackingEntry, error) {
-	data, err := os.ReadFile(o.trackingPath)
-	if os.IsNotExist(err) {
-		return make(map[string]TrackingEntry), nil
-	}
-	if err != nil {
-		return nil, err
-	}
-
-	var tracking map[string]TrackingEntry
-	if err := json.Unmarshal(data, &tracking); err != nil {
+	tracking := make(map[string]TrackingEntry)
+	if err := decodeJSONFile(o.trackingPath, &tracking); err != nil && !os.IsNotExist(err) {
 		return nil, err
 	}
 	return tracking, nil
 }
 
-var rdIDRegex = regexp.MustCompile(`/d/([a-zA-Z0-9]+)`)
+// decodeJSONFile decodes a JSON file straight from disk, without reading
+// the whole file into memory first.
+func decodeJSONFile(path string, v any) error {
+	f, err := os.Open(path)
+	if err != nil {
+		return err
+	}
+	defer f.Close()
+	return json.NewDecoder(f).Decode(v)
+}
 
-// getRDIDFromLink extracts the Real-Debrid ID from a link.
+// getRDIDFromLink extracts the Real-Debrid ID from a link: the alphanumeric
+// run after the first "/d/" that is followed by one.
 func getRDIDFromLink(link string) string {
-	if link == "" {
-		return ""
-	}
-	match := rdIDRegex.FindStringSubmatch(link)
-	if len(match) > 1 {
-		return match[1]
+	for {
+		i := strings.Index(link, "/d/")
+		if i < 0 {
+			return ""
+		}
+		link = link[i+3:]
+		n := 0
+		for n < len(link) && isAlnum(link[n]) {
+			n++
+		}
+		if n > 0 {
+			return link[:n]
+		}
 	}
-	return ""
 }
 
-var illegalCharsRegex = regexp.MustCompile(`[<>:"/\\|?*]`)
+// isAlnum reports whether b is an ASCII letter or digit
+func isAlnum(b byte) bool {
+	return ('a' <= b && b <= 'z') || ('A' <= b && b <= 'Z') || ('0' <= b && b <= '9')
+}
+
+// illegalCharsReplacer deletes characters that are illegal in filenames. A
+// byte-level replacer is a single pass with no regex matching.
+var illegalCharsReplacer = strings.NewReplacer(
+	"<", "", ">", "", ":", "", `"`, "", "/", "", `\`, "", "|", "", "?", "", "*", "",
+)
 
 // cleanFilename removes illegal filesystem characters.
 func cleanFilename(name string) string {
-	return illegalCharsRegex.ReplaceAllString(name, "")
+	return illegalCharsReplacer.Replace(name)
 }
 
-// findExistingSeriesFolder checks if a folder for the series already exists.
-func (o *Organizer) findExistingSeriesFolder(baseFolder, title string, year int) string {
-	searchDir := filepath.Join(o.organizedDir, baseFolder)
-	entries, err := os.ReadDir(searchDir)
-	if err != nil {
-		return ""
-	}
-
-	normalizedTitle := strings.ToLower(strings.TrimSpace(title))
-	targetWithYear := title
+// titleWithYear formats "Title (Year)", or just the title when the year is unknown
+func titleWithYear(title string, year int) string {
 	if year > 0 {
-		targetWithYear = fmt.Sprintf("%s (%d)", title, year)
+		return title + " (" + strconv.Itoa(year) + ")"
 	}
+	return title
+}
 
-	// Check for exact matches first
-	for _, entry := range entries {
-		if !entry.IsDir() {
-			continue
-		}
-		if strings.EqualFold(entry.Name(), targetWithYear) {
-			return entry.Name()
-		}
+// pad2 formats n with at least two digits, like %02d
+func pad2(n int) string {
+	if n >= 0 && n < 10 {
+		return "0" + strconv.Itoa(n)
 	}
+	return strconv.Itoa(n)
+}
 
-	// Check for title match with/without year
-	for _, entry := range entries {
-		if !entry.IsDir() {
-			continue
-		}
-		folderLower := strings.ToLower(entry.Name())
-		if strings.HasPrefix(folderLower, normalizedTitle) {
-			remainder := strings.TrimSpace(strings.TrimPrefix(folderLower, normalizedTitle))
-			if remainder == "" || (strings.HasPrefix(remainder, "(") && strings.HasSuffix(remainder, ")") && len(remainder) == 6) {
-				return entry.Name()
-			}
-		}
-	}
+// findExistingSeriesFolder checks if a folder for the series already exists.
+func (o *Organizer) findExistingSeriesFolder(baseFolder, title string, year int) string {
+	listing := o.listFolders(baseFolder)
 
-	return ""
+	// Lowercase once; the " (Year)" suffix has no case to fold
+	lowerTitle := strings.ToLower(title)
+
+	// Exact "Title (Year)" match first, then title match with/without year
+	if name, ok := listing.exact[titleWithYear(lowerTitle, year)]; ok {
+		return name
+	}
+	return listing.titles[strings.TrimSpace(lowerTitle)]
 }
 
 // getContentTypeAndPath determines content type and destination path.
@@ -312,17 +356,13 @@ func (o *Organizer) getContentTypeAndPath(parsed, parentParsed *ptt.TorrentInfo,
 	if existingFolder != "" {
 		formattedTitle = existingFolder
 	} else {
-		formattedTitle = title
-		if year > 0 {
-			formattedTitle = fmt.Sprintf("%s (%d)", formattedTitle, year)
-		}
-		formattedTitle = cleanFilename(formattedTitle)
+		formattedTitle = cleanFilename(titleWithYear(title, year))
 	}
 
 	// ID suffix
 	idSuffix := ""
 	if rdID != "" {
-		idSuffix = fmt.Sprintf(" [%s]", rdID)
+		idSuffix = " [" + rdID + "]"
 	}
 
 	// Extension
@@ -330,35 +370,34 @@ func (o *Organizer) getContentTypeAndPath(parsed, parentParsed *ptt.TorrentInfo,
 
 	var destPath string
 	if finalType == "movie" {
-		finalFilename := cleanFilename(fmt.Sprintf("%s%s%s", formattedTitle, idSuffix, ext))
+		finalFilename := cleanFilename(formattedTitle + idSuffix + ext)
 		destPath = filepath.Join("Movies", formattedTitle, finalFilename)
 	} else {
-		// Series or Anime
-		var seasonFolder string
+		// Series or Anime; the padded season number is shared by the folder
+		// and the episode tag
+		seasonNum := ""
+		seasonFolder := "Season Unknown"
 		if len(season) > 0 {
-			seasonFolder = fmt.Sprintf("Season %02d", season[0])
-		} else {
-			seasonFolder = "Season Unknown"
+			seasonNum = pad2(season[0])
+			seasonFolder = "Season " + seasonNum
 		}
 
 		var finalFilename string
 		if len(episode) > 0 {
-			var epStr string
-			if len(season) > 0 {
-				epStr = fmt.Sprintf("S%02dE%02d", season[0], episode[0])
-			} else {
-				epStr = fmt.Sprintf("E%02d", episode[0])
+			epStr := "E" + pad2(episode[0])
+			if seasonNum != "" {
+				epStr = "S" + seasonNum + epStr
 			}
-			finalFilename = cleanFilename(fmt.Sprintf("%s %s%s%s", title, epStr, idSuffix, ext))
+			finalFilename = cleanFilename(title + " " + epStr + idSuffix + ext)
 		} else {
 			partName := fTitle
 			if partName == "" {
 				partName = "Unknown"
 			}
 			if strings.EqualFold(partName, title) {
-				finalFilename = cleanFilename(fmt.Sprintf("%s%s%s", title, idSuffix, ext))
+				finalFilename = cleanFilename(title + idSuffix + ext)
 			} else {
-				finalFilename = cleanFilename(fmt.Sprintf("%s - %s%s%s", title, partName, idSuffix, ext))
+				finalFilename = cleanFilename(title + " - " + partName + idSuffix + ext)
 			}
 		}
 
@@ -368,6 +407,37 @@ func (o *Organizer) getContentTypeAndPath(parsed, parentParsed *ptt.TorrentInfo,
 	return finalType, destPath
 }
 
+// linkFile creates hard links; tests swap it to exercise the copy fallback
+var linkFile = os.Link
+
+// placeFile puts src at dst as a hard link, falling back to a copy when the
+// two paths are on different filesystems or links are not supported. The
+// library rewrites STRM files by renaming over them, so a link never sees
+// those later writes; changed files are placed again on the next run.
+// The new file is staged next to dst and renamed over it, so a failed
+// link and copy leaves the previous file in place.
+// The destination folder must already exist.
+func placeFile(src, dst string) error {
+	tmp := dst + ".tmp"
+	if err := os.Remove(tmp); err != nil && !os.IsNotExist(err) {
+		return err
+	}
+	if err := linkFile(src, tmp); err != nil {
+		if err := copyFile(src, tmp); err != nil {
+			os.Remove(tmp)
+			return err
+		}
+	}
+	if err := os.Rename(tmp, dst); err != nil {
+		os.Remove(tmp)
+		return err
+	}
+	// Renaming a hard link over another link to the same file is a no-op
+	// that leaves tmp behind
+	os.Remove(tmp)
+	return nil
+}
+
 // copyFile copies a file from src to dst.
 func copyFile(src, dst string) error {
 	sourceFile, err := os.Open(src)
@@ -376,32 +446,81 @@ func copyFile(src, dst string) error {
 	}
 	defer sourceFile.Close()
 
-	if err := os.MkdirAll(filepath.Dir(dst), 0755); err != nil {
-		return err
-	}
-
 	destFile, err := os.Create(dst)
 	if err != nil {
 		return err
 	}
-	defer destFile.Close()
 
-	_, err = io.Copy(destFile, sourceFile)
-	return err
+	if _, err := io.Copy(destFile, sourceFile); err != nil {
+		destFile.Close()
+		return err
+	}
+	return destFile.Close()
 }
 
-// Run executes the organization process.
-func (o *Organizer) Run() Result {
-	result := Result{}
+// maxCopyWorkers bounds concurrent file copies during a run
+const maxCopyWorkers = 8
 
-	if err := o.loadDB(); err != nil {
-		o.logger.Error().Err(err).Msg("Failed to load organizer database")
-		return result
+// pendingCopy is a file planned for organization, copied once planning is done
+type pendingCopy struct {
+	relPath string
+	src     string
+	dst     string
+	entry   FileEntry
+}
+
+// copyAll places the pending copies in parallel and returns their errors by
+// index. Copies that share a destination run in order within one job, so the
+// last one still wins as it would sequentially.
+func (o *Organizer) copyAll(copies []pendingCopy) []error {
+	copyErrs := make([]error, len(copies))
+	byDst := make(map[string][]int, len(copies))
+	var dstOrder []string
+	for i, c := range copies {
+		if _, ok := byDst[c.dst]; !ok {
+			dstOrder = append(dstOrder, c.dst)
+		}
+		byDst[c.dst] = append(byDst[c.dst], i)
+	}
+	pool := worker.NewPool(maxCopyWorkers)
+	for _, dst := range dstOrder {
+		indexes := byDst[dst] // capture for goroutine
+		pool.Submit(func() {
+			for _, i := range indexes {
+				if err := o.ensureDir(filepath.Dir(copies[i].dst)); err != nil {
+					copyErrs[i] = err
+					continue
+				}
+				copyErrs[i] = placeFile(copies[i].src, copies[i].dst)
+			}
+		})
 	}
+	pool.Wait()
+	return copyErrs
+}
 
+// Run executes the organization process using the tracking file on disk.
+func (o *Organizer) Run() Result {
 	tracking, err := o.loadTracking()
 	if err != nil {
 		o.logger.Error().Err(err).Msg("Failed to load tracking database")
+		return Result{}
+	}
+	return o.RunWithTracking(tracking)
+}
+
+// RunWithTracking executes the organization process for the given tracking
+// entries, keyed by path relative to the library, so callers that already
+// hold them in memory avoid re-reading the tracking file.
+func (o *Organizer) RunWithTracking(tracking map[string]TrackingEntry) Result {
+	result := Result{}
+
+	// Folder listings are only trusted for the length of one run
+	o.folderCache = make(map[string]*folderListing)
+	o.createdDirs = make(map[string]struct{})
+
+	if err := o.loadDB(); err != nil {
+		o.logger.Error().Err(err).Msg("Failed to load organizer database")
 		return result
 	}
 
@@ -409,9 +528,17 @@ func (o *Organizer) Run() Result {
 	currentSourcePaths := make(map[string]bool)
 	newState := make(map[string]FileEntry)
 
+	// One walk per tree instead of a stat per tracked file
+	libraryFiles := o.listFiles(o.libraryDir)
+	organizedFiles := o.listFiles(o.organizedDir)
+	var copies []pendingCopy
+	// Every file of a release shares its parent folder; keep those parses
+	// for the whole run even if the bounded parse cache rolls over
+	parents := make(map[string]*ptt.TorrentInfo)
+
 	for relPath, meta := range tracking {
 		sourceFullPath := filepath.Join(o.libraryDir, relPath)
-		if !fileExists(sourceFullPath) {
+		if !libraryFiles.exists(relPath) {
 			continue
 		}
 		currentSourcePaths[relPath] = true
@@ -419,9 +546,9 @@ func (o *Organizer) Run() Result {
 		// Check if already organized and up to date
 		if prevEntry, exists := o.db[relPath]; exists {
 			currentID := getRDIDFromLink(meta.Link)
-			destFullPath := filepath.Join(o.organizedDir, prevEntry.DestPath)
+			destExists := organizedFiles.exists(prevEntry.DestPath)
 			sameURL := meta.DownloadURL != "" && prevEntry.DownloadURL == meta.DownloadURL
-			if prevEntry.RDID == currentID && fileExists(destFullPath) && (sameURL || meta.DownloadURL == "") {
+			if prevEntry.RDID == currentID && destExists && (sameURL || meta.DownloadURL == "") {
 				newState[relPath] = prevEntry
 				result.Skipped++
 				continue
@@ -433,61 +560,77 @@ func (o *Organizer) Run() Result {
 		// Parse filename
 		filename := filepath.Base(relPath)
 		nameNoExt := strings.TrimSuffix(filename, filepath.Ext(filename))
-		parsed := o.parser.Parse(nameNoExt)
+		parsed := o.parse(nameNoExt)
 
-		// Parse parent folder
+		// Parse parent folder, once per folder this run
 		parentRelDir := filepath.Dir(relPath)
-		parentFolderName := ""
-		if parentRelDir != "" && parentRelDir != "." {
-			parentFolderName = filepath.Base(parentRelDir)
-		}
-
-		var parentParsed *ptt.TorrentInfo
-		if parentFolderName != "" {
-			parentParsed = o.parser.Parse(parentFolderName)
+		parentParsed, seen := parents[parentRelDir]
+		if !seen {
+			if parentRelDir != "" && parentRelDir != "." {
+				parentParsed = o.parse(filepath.Base(parentRelDir))
+			}
+			parents[parentRelDir] = parentParsed
 		}
 
 		rdID := getRDIDFromLink(meta.Link)
 
 		// Determine destination
 		contentType, destRelPath := o.getContentTypeAndPath(parsed, parentParsed, filename, rdID)
-		destFullPath := filepath.Join(o.organizedDir, destRelPath)
-
-		// Copy file
-		if err := copyFile(sourceFullPath, destFullPath); err != nil {
-			o.logger.Error().Err(err).Str("path", relPath).Msg("Failed to organize file")
+		// Later files of the same series should see the folder this one creates
+		o.noteCreated(destRelPath)
+
+		copies = append(copies, pendingCopy{
+			relPath: relPath,
+			src:     sourceFullPath,
+			dst:     filepath.Join(o.organizedDir, destRelPath),
+			entry: FileEntry{
+				DestPath:    destRelPath,
+				RDID:        rdID,
+				Type:        contentType,
+				DownloadURL: meta.DownloadURL,
+				UpdatedAt:   meta.LastChecked,
+			},
+		})
+	}
+
+	// Copy in parallel; parsing and path planning above stay single-threaded
+	copyErrs := o.copyAll(copies)
+
+	for i, c := range copies {
+		if err := copyErrs[i]; err != nil {
+			o.logger.Error().Err(err).Str("path", c.relPath).Msg("Failed to organize file")
 			result.Errors++
 			continue
 		}
-
-		newState[relPath] = FileEntry{
-			DestPath:    destRelPath,
-			RDID:        rdID,
-			Type:        contentType,
-			DownloadURL: meta.DownloadURL,
-			UpdatedAt:   meta.LastChecked,
-		}
+		newState[c.relPath] = c.entry
 		result.New++
 	}
 
 	// Cleanup deleted files
 	for oldSrcPath, oldEntry := range o.db {
 		if !currentSourcePaths[oldSrcPath] {
+			// Remove straight away; an already missing file is not an error
 			destFull := filepath.Join(o.organizedDir, oldEntry.DestPath)
-			if fileExists(destFull) {
-				if err := os.Remove(destFull); err == nil {
-					result.Deleted++
-					// Try to remove empty parent directories
-					o.cleanEmptyDirs(filepath.Dir(destFull))
-				}
+			if err := os.Remove(destFull); err == nil {
+				result.Deleted++
+				// Try to remove empty parent directories
+				o.cleanEmptyDirs(filepath.Dir(destFull))
+			} else if !os.IsNotExist(err) {
+				o.logger.Warn().Err(err).Str("path", oldEntry.DestPath).Msg("Failed to remove organized file")
 			}
 		}
 	}
 
-	// Save new state
+	// Save new state, skipping the write when nothing changed
+	changed := !maps.Equal(o.db, newState)
 	o.db = newState
-	if err := o.saveDB(); err != nil {
-		o.logger.Error().Err(err).Msg("Failed to save organizer database")
+	if changed || o.dbUnsaved {
+		if err := o.saveDB(); err != nil {
+			o.logger.Error().Err(err).Msg("Failed to save organizer database")
+			o.dbUnsaved = true
+		} else {
+			o.dbUnsaved = false
+		}
 	}
 
 	return result
@@ -495,18 +638,15 @@ func (o *Organizer) Run() Result {
 
 // cleanEmptyDirs removes empty directories up to the organized root.
 func (o *Organizer) cleanEmptyDirs(dir string) {
+	// Removing a non-empty directory fails, so no listing is needed. os.Remove
+	// would unlink a symlinked folder whatever its target holds, so stop there.
 	for dir != o.organizedDir && strings.HasPrefix(dir, o.organizedDir) {
-		entries, err := os.ReadDir(dir)
-		if err != nil || len(entries) > 0 {
+		if info, err := os.Lstat(dir); err != nil || !info.IsDir() {
+			break
+		}
+		if err := os.Remove(dir); err != nil {
 			break
 		}
-		os.Remove(dir)
 		dir = filepath.Dir(dir)
 	}
 }
-
-// fileExists checks if a file exists.
-func fileExists(path string) bool {
-	_, err := os.Stat(path)
-	return err == nil
-}
@@ -4,6 +4,7 @@ import (
 	"encoding/json"
 	"os"
 	"path/filepath"
+	"strconv"
 	"testing"
 
 	"github.com/rs/zerolog"
@@ -246,3 +247,401 @@ func TestRun_UsesCWDForRelativeOrganizedDir(t *testing.T) {
 		t.Fatalf("unexpected stat error for config directory target: %v", err)
 	}
 }
+
+func TestGetRDIDFromLink(t *testing.T) {
+	cases := map[string]string{
+		"":                                  "",
+		"https://real-debrid.com/d/ABC123":  "ABC123",
+		"https://real-debrid.com/d/ABC123/": "ABC123",
+		"https://real-debrid.com/d/":        "",
+		"https://real-debrid.com/d//d/XY9":  "XY9",
+		"https://real-debrid.com/x/ABC123":  "",
+	}
+	for link, want := range cases {
+		if got := getRDIDFromLink(link); got != want {
+			t.Errorf("getRDIDFromLink(%q) = %q, want %q", link, got, want)
+		}
+	}
+}
+
+func TestPlaceFile(t *testing.T) {
+	for _, tc := range []struct {
+		name      string
+		linkFails bool
+	}{
+		{name: "link"},
+		{name: "copy fallback", linkFails: true},
+	} {
+		t.Run(tc.name, func(t *testing.T) {
+			if tc.linkFails {
+				orig := linkFile
+				linkFile = func(string, string) error { return os.ErrPermission }
+				t.Cleanup(func() { linkFile = orig })
+			}
+
+			dir := t.TempDir()
+			src := filepath.Join(dir, "src.strm")
+			dst := filepath.Join(dir, "dst.strm")
+			if err := os.WriteFile(src, []byte("new"), 0644); err != nil {
+				t.Fatalf("write src: %v", err)
+			}
+			if err := os.WriteFile(dst, []byte("old"), 0644); err != nil {
+				t.Fatalf("write dst: %v", err)
+			}
+
+			if err := placeFile(src, dst); err != nil {
+				t.Fatalf("placeFile: %v", err)
+			}
+
+			data, err := os.ReadFile(dst)
+			if err != nil || string(data) != "new" {
+				t.Fatalf("dst = %q, %v; want %q", data, err, "new")
+			}
+			srcInfo, _ := os.Stat(src)
+			dstInfo, _ := os.Stat(dst)
+			if linked := os.SameFile(srcInfo, dstInfo); linked == tc.linkFails {
+				t.Fatalf("dst linked to src = %v, want %v", linked, !tc.linkFails)
+			}
+			if _, err := os.Stat(dst + ".tmp"); !os.IsNotExist(err) {
+				t.Fatalf("temp file left behind: %v", err)
+			}
+		})
+	}
+}
+
+func TestPlaceFile_KeepsDestinationOnFailure(t *testing.T) {
+	dir := t.TempDir()
+	dst := filepath.Join(dir, "dst.strm")
+	if err := os.WriteFile(dst, []byte("old"), 0644); err != nil {
+		t.Fatalf("write dst: %v", err)
+	}
+
+	if err := placeFile(filepath.Join(dir, "missing.strm"), dst); err == nil {
+		t.Fatalf("expected error for missing source")
+	}
+
+	data, err := os.ReadFile(dst)
+	if err != nil || string(data) != "old" {
+		t.Fatalf("dst = %q, %v; want previous file kept", data, err)
+	}
+	if _, err := os.Stat(dst + ".tmp"); !os.IsNotExist(err) {
+		t.Fatalf("temp file left behind: %v", err)
+	}
+}
+
+func TestListFiles_FollowsSymlinksLikeStat(t *testing.T) {
+	root := t.TempDir()
+	outside := t.TempDir()
+
+	mustWrite := func(path string) {
+		t.Helper()
+		if err := os.MkdirAll(filepath.Dir(path), 0755); err != nil {
+			t.Fatalf("mkdir: %v", err)
+		}
+		if err := os.WriteFile(path, []byte("x"), 0644); err != nil {
+			t.Fatalf("write: %v", err)
+		}
+	}
+	mustWrite(filepath.Join(root, "Show", "a.strm"))
+	mustWrite(filepath.Join(outside, "b.strm"))
+	mustWrite(filepath.Join(outside, "linked", "c.strm"))
+
+	links := map[string]string{
+		filepath.Join(root, "Show", "file-link.strm"): filepath.Join(outside, "b.strm"),
+		filepath.Join(root, "Show", "dangling.strm"):  filepath.Join(outside, "missing.strm"),
+		filepath.Join(root, "Linked"):                 filepath.Join(outside, "linked"),
+	}
+	for link, target := range links {
+		if err := os.Symlink(target, link); err != nil {
+			t.Skipf("symlinks not supported: %v", err)
+		}
+	}
+
+	o := &Organizer{logger: zerolog.Nop()}
+	set := o.listFiles(root)
+
+	cases := map[string]bool{
+		filepath.Join("Show", "a.strm"):         true,
+		filepath.Join("Show", "file-link.strm"): true,
+		filepath.Join("Show", "dangling.strm"):  false,
+		filepath.Join("Linked", "c.strm"):       true,
+		filepath.Join("Linked", "missing.strm"): false,
+		filepath.Join("Show", "missing.strm"):   false,
+	}
+	for rel, want := range cases {
+		if got := set.exists(rel); got != want {
+			t.Errorf("exists(%q) = %v, want %v", rel, got, want)
+		}
+	}
+}
+
+func TestListFiles_UnreadableFolderFallsBackToStat(t *testing.T) {
+	if os.Geteuid() == 0 {
+		t.Skip("permissions are not enforced for root")
+	}
+
+	root := t.TempDir()
+	locked := filepath.Join(root, "Locked")
+	if err := os.MkdirAll(locked, 0755); err != nil {
+		t.Fatalf("mkdir: %v", err)
+	}
+	if err := os.WriteFile(filepath.Join(locked, "a.strm"), []byte("x"), 0644); err != nil {
+		t.Fatalf("write: %v", err)
+	}
+	// Listing is denied but entries can still be looked up by name
+	if err := os.Chmod(locked, 0311); err != nil {
+		t.Fatalf("chmod: %v", err)
+	}
+	t.Cleanup(func() { os.Chmod(locked, 0755) })
+
+	o := &Organizer{logger: zerolog.Nop()}
+	set := o.listFiles(root)
+
+	if !set.exists(filepath.Join("Locked", "a.strm")) {
+		t.Fatalf("file in an unreadable folder reported missing")
+	}
+	if set.exists(filepath.Join("Locked", "missing.strm")) {
+		t.Fatalf("missing file in an unreadable folder reported present")
+	}
+}
+
+func TestListFiles_MissingRootIsEmpty(t *testing.T) {
+	o := &Organizer{logger: zerolog.Nop()}
+	set := o.listFiles(filepath.Join(t.TempDir(), "missing"))
+	if set.exists("a.strm") {
+		t.Fatalf("file reported present under a missing root")
+	}
+}
+
+func TestFindExistingSeriesFolder(t *testing.T) {
+	organizedDir := t.TempDir()
+	for _, name := range []string{"Show (2019)", "Show (2020)", "Plain Title", "Other (2018)"} {
+		if err := os.MkdirAll(filepath.Join(organizedDir, "Series", name), 0755); err != nil {
+			t.Fatalf("mkdir: %v", err)
+		}
+	}
+	// Files next to the series folders are not series folders
+	if err := os.WriteFile(filepath.Join(organizedDir, "Series", "Stray"), []byte("x"), 0644); err != nil {
+		t.Fatalf("write: %v", err)
+	}
+
+	o := &Organizer{organizedDir: organizedDir, folderCache: make(map[string]*folderListing)}
+
+	cases := []struct {
+		name  string
+		base  string
+		title string
+		year  int
+		want  string
+	}{
+		{name: "exact title and year", base: "Series", title: "Show", year: 2020, want: "Show (2020)"},
+		{name: "exact match ignores case", base: "Series", title: "SHOW", year: 2020, want: "Show (2020)"},
+		{name: "different year takes first listed", base: "Series", title: "Show", year: 2021, want: "Show (2019)"},
+		{name: "no year takes first listed", base: "Series", title: "Show", year: 0, want: "Show (2019)"},
+		{name: "folder without year", base: "Series", title: "Plain Title", year: 2020, want: "Plain Title"},
+		{name: "no matching folder", base: "Series", title: "Missing", year: 2020, want: ""},
+		{name: "file is not a folder", base: "Series", title: "Stray", year: 0, want: ""},
+		{name: "missing base folder", base: "Anime", title: "Show", year: 2020, want: ""},
+	}
+	for _, tc := range cases {
+		t.Run(tc.name, func(t *testing.T) {
+			if got := o.findExistingSeriesFolder(tc.base, tc.title, tc.year); got != tc.want {
+				t.Fatalf("findExistingSeriesFolder(%q, %q, %d) = %q, want %q", tc.base, tc.title, tc.year, got, tc.want)
+			}
+		})
+	}
+}
+
+func TestFindExistingSeriesFolder_SeesFoldersCreatedDuringRun(t *testing.T) {
+	organizedDir := t.TempDir()
+	o := &Organizer{organizedDir: organizedDir, folderCache: make(map[string]*folderListing)}
+
+	if got := o.findExistingSeriesFolder("Series", "New Show", 2022); got != "" {
+		t.Fatalf("found %q before the folder was created", got)
+	}
+
+	// The listing is cached, so the new folder is only seen through noteCreated
+	created := filepath.Join("Series", "New Show (2022)", "Season 01", "New Show (2022) - S01E01.strm")
+	if err := os.MkdirAll(filepath.Join(organizedDir, filepath.Dir(created)), 0755); err != nil {
+		t.Fatalf("mkdir: %v", err)
+	}
+	o.noteCreated(created)
+
+	if got := o.findExistingSeriesFolder("Series", "New Show", 2022); got != "New Show (2022)" {
+		t.Fatalf("found %q after creation, want %q", got, "New Show (2022)")
+	}
+	if got := o.findExistingSeriesFolder("Series", "new show", 2023); got != "New Show (2022)" {
+		t.Fatalf("title lookup found %q after creation, want %q", got, "New Show (2022)")
+	}
+
+	// Paths outside a title folder and uncached bases are ignored
+	o.noteCreated("Loose.strm")
+	o.noteCreated(filepath.Join("Series", "Loose.strm"))
+	o.noteCreated(filepath.Join("Movies", "Film (2020)", "Film (2020).strm"))
+	if _, ok := o.folderCache["Movies"]; ok {
+		t.Fatalf("noteCreated cached a listing for an unread base folder")
+	}
+	if _, ok := o.folderCache["Series"].seen["Loose.strm"]; ok {
+		t.Fatalf("noteCreated listed a file as a folder")
+	}
+}
+
+func TestCopyAll(t *testing.T) {
+	baseDir := t.TempDir()
+	libraryDir := filepath.Join(baseDir, "library")
+	organizedDir := filepath.Join(baseDir, "library-organized")
+	if err := os.MkdirAll(libraryDir, 0755); err != nil {
+		t.Fatalf("mkdir library: %v", err)
+	}
+	// A file where a destination folder is needed makes ensureDir fail
+	if err := os.MkdirAll(filepath.Join(organizedDir, "Movies"), 0755); err != nil {
+		t.Fatalf("mkdir organized: %v", err)
+	}
+	if err := os.WriteFile(filepath.Join(organizedDir, "Movies", "Blocked"), []byte("x"), 0644); err != nil {
+		t.Fatalf("write blocker: %v", err)
+	}
+
+	var copies []pendingCopy
+	want := make(map[string]string) // dst -> content
+	addCopy := func(content, dstRel string) {
+		src := filepath.Join(libraryDir, strconv.Itoa(len(copies))+".strm")
+		if err := os.WriteFile(src, []byte(content), 0644); err != nil {
+			t.Fatalf("write src: %v", err)
+		}
+		dst := filepath.Join(organizedDir, dstRel)
+		copies = append(copies, pendingCopy{relPath: dstRel, src: src, dst: dst})
+		want[dst] = content
+	}
+
+	// More distinct destinations than workers, sharing season folders
+	for i := 0; i < 3*maxCopyWorkers; i++ {
+		season := "Season 0" + strconv.Itoa(i%3+1)
+		addCopy("episode-"+strconv.Itoa(i), filepath.Join("Series", "Show", season, "E"+strconv.Itoa(i)+".strm"))
+	}
+	// Several sources for one destination: the last one planned wins
+	shared := filepath.Join("Movies", "Film (2020)", "Film (2020).strm")
+	sharedFirst := len(copies)
+	for _, content := range []string{"first", "second", "third"} {
+		addCopy(content, shared)
+	}
+	// A missing source and an unusable folder fail only their own copy
+	missing := len(copies)
+	copies = append(copies, pendingCopy{
+		src: filepath.Join(libraryDir, "missing.strm"),
+		dst: filepath.Join(organizedDir, "Movies", "Missing", "Missing.strm"),
+	})
+	blocked := len(copies)
+	copies = append(copies, pendingCopy{
+		src: copies[0].src,
+		dst: filepath.Join(organizedDir, "Movies", "Blocked", "Blocked.strm"),
+	})
+
+	o := &Organizer{organizedDir: organizedDir, createdDirs: make(map[string]struct{})}
+	errs := o.copyAll(copies)
+
+	if len(errs) != len(copies) {
+		t.Fatalf("got %d results for %d copies", len(errs), len(copies))
+	}
+	for i, err := range errs {
+		if wantErr := i == missing || i == blocked; (err != nil) != wantErr {
+			t.Errorf("copy %d (%s): err = %v, want error %v", i, copies[i].dst, err, wantErr)
+		}
+	}
+	for dst, content := range want {
+		data, err := os.ReadFile(dst)
+		if err != nil || string(data) != content {
+			t.Errorf("%s = %q, %v; want %q", dst, data, err, content)
+		}
+	}
+	if data, _ := os.ReadFile(copies[sharedFirst].dst); string(data) != "third" {
+		t.Fatalf("shared destination = %q, want the last copy %q", data, "third")
+	}
+	if _, err := os.Stat(copies[missing].dst); !os.IsNotExist(err) {
+		t.Fatalf("destination created for a missing source: %v", err)
+	}
+}
+
+func TestRunWithTracking_CountsParallelCopies(t *testing.T) {
+	baseDir := t.TempDir()
+	libraryDir := filepath.Join(baseDir, "library")
+	organizedDir := filepath.Join(baseDir, "library-organized")
+	cacheDir := filepath.Join(baseDir, "cache")
+
+	// More movies than copy workers, each with its own destination
+	names := []string{
+		"Apple", "Birch", "Cedar", "Dune", "Ember", "Fjord", "Grove", "Harbor",
+		"Iris", "Juniper", "Kestrel", "Lantern", "Meadow", "Nimbus", "Orchard", "Prairie",
+	}
+	tracking := make(map[string]TrackingEntry)
+	for i, name := range names {
+		id := "ID" + strconv.Itoa(1000+i)
+		title := name + " (2024)"
+		relPath := filepath.Join("Movies", title, title+" ["+id+"].strm")
+		fullPath := filepath.Join(libraryDir, relPath)
+		if err := os.MkdirAll(filepath.Dir(fullPath), 0755); err != nil {
+			t.Fatalf("mkdir source dir: %v", err)
+		}
+		if err := os.WriteFile(fullPath, []byte("https://example/"+id), 0644); err != nil {
+			t.Fatalf("write source file: %v", err)
+		}
+		tracking[relPath] = TrackingEntry{Link: "https://real-debrid.com/d/" + id, DownloadURL: "https://example/" + id}
+	}
+	// Tracked but not on disk: neither copied nor counted as an error
+	tracking[filepath.Join("Movies", "Gone (2024)", "Gone (2024) [GONE].strm")] = TrackingEntry{Link: "https://real-debrid.com/d/GONE"}
+
+	org := New(Config{
+		BaseDir:      baseDir,
+		OrganizedDir: organizedDir,
+		OutputDir:    libraryDir,
+		CacheDir:     cacheDir,
+		Logger:       zerolog.Nop(),
+	})
+
+	result := org.RunWithTracking(tracking)
+	if result.Processed != len(tracking) || result.New != len(tracking)-1 || result.Errors != 0 {
+		t.Fatalf("got processed=%d new=%d errors=%d, want %d, %d, 0",
+			result.Processed, result.New, result.Errors, len(tracking), len(tracking)-1)
+	}
+	if len(org.db) != result.New {
+		t.Fatalf("organizer DB has %d entries, want %d", len(org.db), result.New)
+	}
+	for relPath, entry := range org.db {
+		data, err := os.ReadFile(filepath.Join(organizedDir, entry.DestPath))
+		if err != nil || string(data) != tracking[relPath].DownloadURL {
+			t.Errorf("%s = %q, %v; want %q", entry.DestPath, data, err, tracking[relPath].DownloadURL)
+		}
+	}
+
+	// A second run finds everything up to date
+	again := org.RunWithTracking(tracking)
+	if again.Skipped != result.New || again.New != 0 {
+		t.Fatalf("second run: skipped=%d new=%d, want %d, 0", again.Skipped, again.New, result.New)
+	}
+}
+
+func TestCleanEmptyDirs_KeepsSymlinkedFolder(t *testing.T) {
+	organizedDir := t.TempDir()
+	target := filepath.Join(t.TempDir(), "Movies")
+	emptied := filepath.Join(target, "Film (2020)")
+	if err := os.MkdirAll(emptied, 0755); err != nil {
+		t.Fatalf("mkdir: %v", err)
+	}
+	link := filepath.Join(organizedDir, "Movies")
+	if err := os.Symlink(target, link); err != nil {
+		t.Skipf("symlinks not supported: %v", err)
+	}
+
+	o := &Organizer{organizedDir: organizedDir}
+	o.cleanEmptyDirs(filepath.Join(link, "Film (2020)"))
+
+	if _, err := os.Stat(emptied); !os.IsNotExist(err) {
+		t.Fatalf("empty folder inside the link was kept: %v", err)
+	}
+	// The link stays even though its target is now empty
+	if info, err := os.Lstat(link); err != nil || info.Mode()&os.ModeSymlink == 0 {
+		t.Fatalf("symlinked folder was removed: %v", err)
+	}
+	if _, err := os.Stat(target); err != nil {
+		t.Fatalf("link target was removed: %v", err)
+	}
+}
@@ -1,8 +1,12 @@
 package realdebrid
 
 import (
+	"context"
 	"fmt"
+	"io"
+	"net/http"
 	"sync"
+	"time"
 
 	"github.com/robofuse/robofuse/internal/config"
 	"github.com/robofuse/robofuse/internal/logger"
@@ -25,7 +29,16 @@ type Client struct {
 	logger zerolog.Logger
 	config *config.Config
 
-	mu sync.RWMutex
+	// pageCache holds the last ETag and raw body per list page URL
+	pageCache map[string]cachedPage
+	mu        sync.RWMutex
+}
+
+// cachedPage is a list page kept for conditional requests
+type cachedPage struct {
+	etag  string
+	body  []byte // undecoded JSON, so each 304 yields fresh items
+	total int
 }
 
 // New creates a new Real-Debrid client
@@ -33,7 +46,7 @@ func New(cfg *config.Config) *Client {
 	log := logger.New("realdebrid")
 
 	headers := map[string]string{
-		"Authorization": fmt.Sprintf("Bearer %s", cfg.Token),
+		"Authorization": "Bearer " + cfg.Token,
 	}
 
 	// Create rate limiters
@@ -48,17 +61,23 @@ func New(cfg *config.Config) *Client {
 		torrentsRL = rate.NewLimiter(rate.Limit(0.4), 1) // ~25 req/min
 	}
 
-	// General client for most endpoints
+	// General client for most endpoints. HTTP/2 multiplexes concurrent workers
+	// over one connection; if the server only speaks HTTP/1.1 there are enough
+	// keep-alive connections for every worker
 	generalClient := request.New(
 		request.WithHeaders(headers),
 		request.WithRateLimiter(generalRL),
 		request.WithLogger(log),
 		request.WithMaxRetries(5),
 		request.WithRetryableStatus(429, 502, 503),
+		request.WithMaxIdleConnsPerHost(cfg.ConcurrentRequests),
+		request.WithHTTP2(true),
 	)
 
-	// Torrents client with stricter rate limiting
+	// Torrents client with stricter rate limiting, sharing the general
+	// client's connection pool
 	torrentsClient := request.New(
+		request.WithTransport(generalClient.Transport()),
 		request.WithHeaders(headers),
 		request.WithRateLimiter(torrentsRL),
 		request.WithLogger(log),
@@ -73,9 +92,39 @@ func New(cfg *config.Config) *Client {
 		torrentsClient: torrentsClient,
 		logger:         log,
 		config:         cfg,
+		pageCache:      make(map[string]cachedPage),
 	}
 }
 
+// endpoint builds an API URL from a path relative to Host
+func (c *Client) endpoint(path string) string {
+	return c.Host + "/" + path
+}
+
+// Warmup requests /user once so the first real call finds an open,
+// TLS-established connection in the pool. It also verifies the API token.
+func (c *Client) Warmup() error {
+	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
+	defer cancel()
+
+	req, _ := http.NewRequestWithContext(ctx, http.MethodGet, c.endpoint("user"), nil)
+
+	resp, err := c.generalClient.Do(req)
+	if err != nil {
+		return fmt.Errorf("warming up connection: %w", err)
+	}
+	defer resp.Body.Close()
+
+	// Drain the body so the connection goes back to the pool
+	_, _ = io.Copy(io.Discard, resp.Body)
+
+	if resp.StatusCode != http.StatusOK {
+		return fmt.Errorf("API error: status %d", resp.StatusCode)
+	}
+
+	return nil
+}
+
 // GetLogger returns the client's logger
 func (c *Client) GetLogger() zerolog.Logger {
 	return c.logger
@@ -1,10 +1,10 @@
 package realdebrid
 
 import (
-	"encoding/json"
 	"fmt"
 	"io"
 	"net/http"
+	"strconv"
 )
 
 // downloads.go fetches and normalizes Real-Debrid downloads.
@@ -14,104 +14,77 @@ import (
 func (c *Client) GetDownloads() ([]*Download, error) {
 	c.logger.Debug().Msg("Fetching all downloads with pagination...")
 
-	var allDownloads []*Download
-	offset := 0
+	// Filter for streamable and deduplicate by link (keep latest generated)
+	// page by page instead of collecting every download first
+	var unique uniqueDownloads
+	total := 0
 	limit := 5000 // Downloads API allows higher limits
 
-	for {
-		url := fmt.Sprintf("%s/downloads?limit=%d", c.Host, limit)
-		if offset > 0 {
-			url = fmt.Sprintf("%s&offset=%d", url, offset)
+	err := paginate(c, c.generalClient, limit, 0, func(page int) string {
+		url := c.endpoint("downloads?limit=" + strconv.Itoa(limit))
+		if page > 0 {
+			url = url + "&offset=" + strconv.Itoa(page*limit)
 		}
-
-		req, _ := http.NewRequest(http.MethodGet, url, nil)
-
-		resp, err := c.generalClient.Do(req)
-		if err != nil {
-			return nil, fmt.Errorf("fetching downloads at offset %d: %w", offset, err)
-		}
-
-		if resp.StatusCode == http.StatusNoContent {
-			resp.Body.Close()
-			break
-		}
-
-		if resp.StatusCode != http.StatusOK {
-			resp.Body.Close()
-			return nil, fmt.Errorf("API error at offset %d: status %d", offset, resp.StatusCode)
-		}
-
-		body, err := io.ReadAll(resp.Body)
-		resp.Body.Close()
-		if err != nil {
-			return nil, fmt.Errorf("reading response: %w", err)
-		}
-
-		var downloads []*Download
-		if err := json.Unmarshal(body, &downloads); err != nil {
-			return nil, fmt.Errorf("parsing downloads: %w", err)
-		}
-
-		if len(downloads) == 0 {
-			break
-		}
-
-		allDownloads = append(allDownloads, downloads...)
+		return url
+	}, func(page int, downloads []*Download) {
+		total += len(downloads)
+		unique.add(downloads)
 		c.logger.Debug().
-			Int("offset", offset).
+			Int("offset", page*limit).
 			Int("count", len(downloads)).
-			Int("total", len(allDownloads)).
+			Int("total", total).
 			Msg("Fetched downloads batch")
-
-		if len(downloads) < limit {
-			break
-		}
-
-		offset += len(downloads)
-	}
-
-	// Filter for streamable only
-	var streamable []*Download
-	for _, d := range allDownloads {
-		if d.IsStreamable() {
-			streamable = append(streamable, d)
-		}
+	})
+	if err != nil {
+		return nil, fmt.Errorf("fetching downloads: %w", err)
 	}
-
-	// Deduplicate by link (keep latest generated)
-	deduped := c.deduplicateDownloads(streamable)
+	deduped := unique.items
 
 	c.logger.Debug().
-		Int("total", len(allDownloads)).
-		Int("streamable", len(streamable)).
+		Int("total", total).
+		Int("streamable", unique.streamable).
 		Int("deduped", len(deduped)).
 		Msg("Downloads fetched and filtered")
 
 	return deduped, nil
 }
 
-// deduplicateDownloads removes duplicate downloads with same link, keeping the latest
-func (c *Client) deduplicateDownloads(downloads []*Download) []*Download {
-	linkMap := make(map[string]*Download)
+// uniqueDownloads collects streamable downloads, keeping only the latest per link.
+// Items keep the order in which each link was first seen.
+type uniqueDownloads struct {
+	index      map[string]int // link -> position in items
+	items      []*Download
+	streamable int // streamable downloads seen before deduplication
+}
+
+// add filters one page of downloads into the set
+func (u *uniqueDownloads) add(downloads []*Download) {
+	if u.index == nil {
+		u.index = make(map[string]int, len(downloads))
+		u.items = make([]*Download, 0, len(downloads))
+	}
 
 	for _, d := range downloads {
-		existing, exists := linkMap[d.Link]
-		if !exists || d.Generated.After(existing.Generated) {
-			linkMap[d.Link] = d
+		if !d.IsStreamable() {
+			continue
 		}
-	}
+		u.streamable++
 
-	result := make([]*Download, 0, len(linkMap))
-	for _, d := range linkMap {
-		result = append(result, d)
+		i, exists := u.index[d.Link]
+		if !exists {
+			u.index[d.Link] = len(u.items)
+			u.items = append(u.items, d)
+			continue
+		}
+		if d.Generated.After(u.items[i].Generated) {
+			u.items[i] = d
+		}
 	}
-
-	return result
 }
 
 // DeleteDownload deletes a download from Real-Debrid
 func (c *Client) DeleteDownload(downloadID string) error {
-	url := fmt.Sprintf("%s/downloads/delete/%s", c.Host, downloadID)
+	url := c.endpoint("downloads/delete/" + downloadID)
 	req, _ := http.NewRequest(http.MethodDelete, url, nil)
 
 	resp, err := c.generalClient.Do(req)
@@ -0,0 +1,189 @@
+package realdebrid
+
+import (
+	"context"
+	"encoding/json"
+	"fmt"
+	"io"
+	"net/http"
+	"strconv"
+
+	"github.com/robofuse/robofuse/internal/request"
+)
+
+// paginate.go walks paginated list endpoints with one page of lookahead.
+
+// pageResult is the outcome of fetching a single page
+type pageResult[T any] struct {
+	items []T
+	total int // X-Total-Count reported by the API, 0 if missing
+	err   error
+}
+
+// fetchPage requests one page of a list endpoint and decodes it.
+// A 204 response means there are no more items. Pages that came with an
+// ETag are requested with If-None-Match, and a 304 decodes the body kept from
+// last time instead of downloading the page again. Decoding on every call
+// means callers always get fresh items they are free to modify.
+func fetchPage[T any](ctx context.Context, c *Client, client *request.Client, url string) ([]T, int, error) {
+	req, _ := http.NewRequestWithContext(ctx, http.MethodGet, url, nil)
+
+	c.mu.RLock()
+	cached, hasCached := c.pageCache[url]
+	c.mu.RUnlock()
+	if hasCached {
+		req.Header.Set("If-None-Match", cached.etag)
+	}
+
+	resp, err := client.Do(req)
+	if err != nil {
+		return nil, 0, err
+	}
+	defer resp.Body.Close()
+
+	if resp.StatusCode == http.StatusNotModified && hasCached {
+		var items []T
+		if err := json.Unmarshal(cached.body, &items); err != nil {
+			return nil, 0, fmt.Errorf("parsing cached response: %w", err)
+		}
+		return items, cached.total, nil
+	}
+
+	if resp.StatusCode == http.StatusNoContent {
+		c.forgetPage(url)
+		return nil, 0, nil
+	}
+
+	if resp.StatusCode != http.StatusOK {
+		return nil, 0, fmt.Errorf("API error: status %d", resp.StatusCode)
+	}
+
+	total, _ := strconv.Atoi(resp.Header.Get("X-Total-Count"))
+
+	etag := resp.Header.Get("ETag")
+	if etag == "" {
+		if hasCached {
+			c.forgetPage(url)
+		}
+		// Decode straight from the body instead of buffering the whole page first
+		var items []T
+		if err := json.NewDecoder(resp.Body).Decode(&items); err != nil {
+			return nil, 0, fmt.Errorf("parsing response: %w", err)
+		}
+		return items, total, nil
+	}
+
+	// Keep the raw page so a 304 can be decoded again later
+	body, err := io.ReadAll(resp.Body)
+	if err != nil {
+		return nil, 0, fmt.Errorf("reading response: %w", err)
+	}
+	var items []T
+	if err := json.Unmarshal(body, &items); err != nil {
+		return nil, 0, fmt.Errorf("parsing response: %w", err)
+	}
+
+	c.mu.Lock()
+	c.pageCache[url] = cachedPage{etag: etag, body: body, total: total}
+	c.mu.Unlock()
+
+	return items, total, nil
+}
+
+// forgetPage drops a cached list page
+func (c *Client) forgetPage(url string) {
+	c.mu.Lock()
+	delete(c.pageCache, url)
+	c.mu.Unlock()
+}
+
+// forgetPagesFrom drops cached pages from page on, so pages past the end of a
+// list that has shrunk are not kept forever. Pages are cached in order, so
+// the first missing page ends the scan.
+func (c *Client) forgetPagesFrom(page int, pageURL func(page int) string) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	for ; ; page++ {
+		url := pageURL(page)
+		if _, ok := c.pageCache[url]; !ok {
+			return
+		}
+		delete(c.pageCache, url)
+	}
+}
+
+// paginate fetches pages from a list endpoint and passes them to handle in order.
+// While page N is being fetched, page N+1 is already requested, so large accounts
+// don't pay a full round trip per page. Once the first page reports X-Total-Count,
+// all remaining pages are requested up front, bounded by concurrent_requests and
+// paced by the client's rate limiter. Outstanding requests are cancelled once a
+// short page shows the end of the list. maxPages of 0 means no page limit.
+func paginate[T any](c *Client, client *request.Client, limit, maxPages int, pageURL func(page int) string, handle func(page int, items []T)) error {
+	ctx, cancel := context.WithCancel(context.Background())
+	defer cancel()
+
+	sem := make(chan struct{}, c.config.ConcurrentRequests)
+	launched := make(map[int]<-chan pageResult[T])
+	knownPages := 0 // page count derived from X-Total-Count, 0 until known
+
+	launch := func(page int) <-chan pageResult[T] {
+		if ch, ok := launched[page]; ok {
+			return ch
+		}
+		ch := make(chan pageResult[T], 1)
+		launched[page] = ch
+		go func() {
+			select {
+			case sem <- struct{}{}:
+			case <-ctx.Done():
+				ch <- pageResult[T]{err: ctx.Err()}
+				return
+			}
+			defer func() { <-sem }()
+
+			items, total, err := fetchPage[T](ctx, c, client, pageURL(page))
+			ch <- pageResult[T]{items: items, total: total, err: err}
+		}()
+		return ch
+	}
+
+	for page := 0; ; page++ {
+		if maxPages > 0 && page >= maxPages {
+			c.logger.Warn().Msgf("Safety limit reached (%d pages)", maxPages)
+			return nil
+		}
+
+		inflight := launch(page)
+		if (maxPages == 0 || page+1 < maxPages) && (knownPages == 0 || page+1 < knownPages) {
+			launch(page + 1)
+		}
+
+		res := <-inflight
+		delete(launched, page)
+		if res.err != nil {
+			return fmt.Errorf("page %d: %w", page+1, res.err)
+		}
+
+		if page == 0 && res.total > limit {
+			knownPages = (res.total + limit - 1) / limit
+			if maxPages > 0 && knownPages > maxPages {
+				knownPages = maxPages
+			}
+			for p := 2; p < knownPages; p++ {
+				launch(p)
+			}
+		}
+
+		if len(res.items) == 0 {
+			c.forgetPagesFrom(page+1, pageURL)
+			return nil
+		}
+
+		handle(page, res.items)
+
+		if len(res.items) < limit {
+			c.forgetPagesFrom(page+1, pageURL)
+			return nil
+		}
+	}
+}
@@ -0,0 +1,262 @@
+package realdebrid
+
+import (
+	"context"
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"strconv"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/robofuse/robofuse/internal/config"
+)
+
+// paginate_test.go verifies page ordering, end-of-list handling and ETag reuse.
+
+type testItem struct {
+	ID int `json:"id"`
+}
+
+// newTestClient returns a client with rate limits high enough not to slow tests
+func newTestClient(host string) *Client {
+	c := New(&config.Config{
+		Token:              "token",
+		ConcurrentRequests: 4,
+		GeneralRateLimit:   600000,
+		TorrentsRateLimit:  600000,
+	})
+	c.Host = host
+	return c
+}
+
+// pageServer serves pages of total items, limit per page. Pages past the end
+// answer 204. Every page carries an ETag and honors If-None-Match.
+type pageServer struct {
+	mu       sync.Mutex
+	total    int
+	limit    int
+	delay    map[int]time.Duration // per 1-based page
+	requests map[int]int
+	notMod   int
+	fail     map[int]int // per 1-based page, status to answer with
+}
+
+func (p *pageServer) ServeHTTP(w http.ResponseWriter, r *http.Request) {
+	page, _ := strconv.Atoi(r.URL.Query().Get("page"))
+
+	p.mu.Lock()
+	p.requests[page]++
+	total, limit, delay, fail := p.total, p.limit, p.delay[page], p.fail[page]
+	p.mu.Unlock()
+
+	time.Sleep(delay)
+
+	if fail != 0 {
+		w.WriteHeader(fail)
+		return
+	}
+
+	start := (page - 1) * limit
+	if start >= total {
+		w.WriteHeader(http.StatusNoContent)
+		return
+	}
+	end := min(start+limit, total)
+
+	etag := `"` + strconv.Itoa(total) + "-" + strconv.Itoa(page) + `"`
+	if r.Header.Get("If-None-Match") == etag {
+		p.mu.Lock()
+		p.notMod++
+		p.mu.Unlock()
+		w.WriteHeader(http.StatusNotModified)
+		return
+	}
+
+	items := make([]testItem, 0, end-start)
+	for i := start; i < end; i++ {
+		items = append(items, testItem{ID: i})
+	}
+	w.Header().Set("ETag", etag)
+	w.Header().Set("X-Total-Count", strconv.Itoa(total))
+	json.NewEncoder(w).Encode(items)
+}
+
+// collect runs paginate against srv and returns the items in handled order
+func collect(t *testing.T, c *Client, srv *httptest.Server, limit int) []*testItem {
+	t.Helper()
+	var got []*testItem
+	lastPage := -1
+	err := paginate(c, c.generalClient, limit, 0, func(page int) string {
+		return srv.URL + "/items?page=" + strconv.Itoa(page+1)
+	}, func(page int, items []*testItem) {
+		if page != lastPage+1 {
+			t.Errorf("handled page %d after page %d", page, lastPage)
+		}
+		lastPage = page
+		got = append(got, items...)
+	})
+	if err != nil {
+		t.Fatalf("paginate: %v", err)
+	}
+	return got
+}
+
+func assertSequence(t *testing.T, got []*testItem, n int) {
+	t.Helper()
+	if len(got) != n {
+		t.Fatalf("got %d items, want %d", len(got), n)
+	}
+	for i, item := range got {
+		if item.ID != i {
+			t.Fatalf("item %d has id %d; pages handled out of order", i, item.ID)
+		}
+	}
+}
+
+func TestPaginate_HandlesPagesInOrder(t *testing.T) {
+	for _, tc := range []struct {
+		name  string
+		total int
+	}{
+		{name: "short last page", total: 7},
+		{name: "full last page", total: 9},
+		{name: "single short page", total: 2},
+		{name: "empty list", total: 0},
+	} {
+		t.Run(tc.name, func(t *testing.T) {
+			// Early pages answer last, so later pages arrive first
+			ps := &pageServer{
+				total:    tc.total,
+				limit:    3,
+				delay:    map[int]time.Duration{1: 30 * time.Millisecond, 2: 15 * time.Millisecond},
+				requests: make(map[int]int),
+			}
+			srv := httptest.NewServer(ps)
+			defer srv.Close()
+
+			assertSequence(t, collect(t, newTestClient(srv.URL), srv, 3), tc.total)
+		})
+	}
+}
+
+func TestFetchPage_ReusesCachedPageOnNotModified(t *testing.T) {
+	ps := &pageServer{total: 5, limit: 3, requests: make(map[int]int)}
+	srv := httptest.NewServer(ps)
+	defer srv.Close()
+	c := newTestClient(srv.URL)
+
+	first := collect(t, c, srv, 3)
+	assertSequence(t, first, 5)
+
+	// Callers may modify what they get back without touching the cache
+	first[0].ID = 99
+
+	second := collect(t, c, srv, 3)
+	assertSequence(t, second, 5)
+	ps.mu.Lock()
+	defer ps.mu.Unlock()
+	if ps.notMod != 2 {
+		t.Fatalf("got %d not-modified responses, want 2", ps.notMod)
+	}
+}
+
+func TestFetchPage_NoContentForgetsPage(t *testing.T) {
+	ps := &pageServer{total: 3, limit: 3, requests: make(map[int]int)}
+	srv := httptest.NewServer(ps)
+	defer srv.Close()
+	c := newTestClient(srv.URL)
+	url := srv.URL + "/items?page=1"
+
+	if _, _, err := fetchPage[*testItem](context.Background(), c, c.generalClient, url); err != nil {
+		t.Fatalf("fetchPage: %v", err)
+	}
+	if _, ok := c.pageCache[url]; !ok {
+		t.Fatalf("page with ETag was not cached")
+	}
+
+	ps.mu.Lock()
+	ps.total = 0
+	ps.mu.Unlock()
+
+	items, _, err := fetchPage[*testItem](context.Background(), c, c.generalClient, url)
+	if err != nil || items != nil {
+		t.Fatalf("fetchPage after 204 = %v, %v; want no items", items, err)
+	}
+	if _, ok := c.pageCache[url]; ok {
+		t.Fatalf("page was kept after a 204")
+	}
+}
+
+func TestPaginate_PrunesPagesPastShrunkenList(t *testing.T) {
+	ps := &pageServer{total: 9, limit: 3, requests: make(map[int]int)}
+	srv := httptest.NewServer(ps)
+	defer srv.Close()
+	c := newTestClient(srv.URL)
+
+	assertSequence(t, collect(t, c, srv, 3), 9)
+
+	ps.mu.Lock()
+	ps.total = 4
+	ps.mu.Unlock()
+
+	assertSequence(t, collect(t, c, srv, 3), 4)
+
+	for page := 3; page <= 4; page++ {
+		if _, ok := c.pageCache[srv.URL+"/items?page="+strconv.Itoa(page)]; ok {
+			t.Fatalf("page %d past the end is still cached", page)
+		}
+	}
+}
+
+func TestPaginate_StopsAtMaxPages(t *testing.T) {
+	ps := &pageServer{total: 30, limit: 3, requests: make(map[int]int)}
+	srv := httptest.NewServer(ps)
+	defer srv.Close()
+	c := newTestClient(srv.URL)
+
+	var got []*testItem
+	err := paginate(c, c.generalClient, 3, 2, func(page int) string {
+		return srv.URL + "/items?page=" + strconv.Itoa(page+1)
+	}, func(page int, items []*testItem) {
+		got = append(got, items...)
+	})
+	if err != nil {
+		t.Fatalf("paginate: %v", err)
+	}
+	assertSequence(t, got, 6)
+
+	ps.mu.Lock()
+	defer ps.mu.Unlock()
+	for page := 3; page <= 10; page++ {
+		if ps.requests[page] != 0 {
+			t.Fatalf("page %d was requested past the page limit", page)
+		}
+	}
+}
+
+func TestPaginate_ReturnsPageError(t *testing.T) {
+	ps := &pageServer{
+		total:    12,
+		limit:    3,
+		requests: make(map[int]int),
+		fail:     map[int]int{2: http.StatusInternalServerError},
+	}
+	srv := httptest.NewServer(ps)
+	defer srv.Close()
+	c := newTestClient(srv.URL)
+
+	handled := 0
+	err := paginate(c, c.generalClient, 3, 0, func(page int) string {
+		return srv.URL + "/items?page=" + strconv.Itoa(page+1)
+	}, func(page int, items []*testItem) {
+		handled++
+	})
+	if err == nil {
+		t.Fatalf("expected an error for the failing page")
+	}
+	if handled != 1 {
+		t.Fatalf("handled %d pages, want only the page before the failure", handled)
+	}
+}
@@ -7,6 +7,7 @@ import (
 	"net/http"
 	gourl "net/url"
 	"path/filepath"
+	"strconv"
 	"strings"
 
 	"github.com/robofuse/robofuse/internal/request"
@@ -14,84 +15,51 @@ import (
 
 // torrents.go fetches torrents and dead/healthy classification details.
 
+// selectableVideoExts are the file extensions selected when (re)adding a torrent
+var selectableVideoExts = map[string]bool{
+	".mkv": true,
+	".mp4": true,
+}
+
+// TorrentsPageSize is the number of torrents GetTorrents requests per page.
+// It must be 100 or less for the API to include links.
+const TorrentsPageSize = 100
+
 // GetTorrents fetches all torrents with pagination (limit=100 to ensure links are returned)
 // Returns: downloaded torrents, dead torrents, error
 func (c *Client) GetTorrents() ([]*Torrent, []*Torrent, error) {
 	c.logger.Debug().Msg("Fetching all torrents with pagination...")
 
-	var allTorrents []*Torrent
-	page := 1
-	limit := 100 // IMPORTANT: Must be 100 or less to get links
-
-	for {
-		url := fmt.Sprintf("%s/torrents?page=%d&limit=%d", c.Host, page, limit)
-		req, _ := http.NewRequest(http.MethodGet, url, nil)
-
-		resp, err := c.torrentsClient.Do(req)
-		if err != nil {
-			return nil, nil, fmt.Errorf("fetching torrents page %d: %w", page, err)
-		}
-
-		if resp.StatusCode == http.StatusNoContent {
-			resp.Body.Close()
-			break
-		}
-
-		if resp.StatusCode != http.StatusOK {
-			resp.Body.Close()
-			return nil, nil, fmt.Errorf("API error on page %d: status %d", page, resp.StatusCode)
-		}
-
-		body, err := io.ReadAll(resp.Body)
-		resp.Body.Close()
-		if err != nil {
-			return nil, nil, fmt.Errorf("reading response: %w", err)
-		}
-
-		var torrents []*Torrent
-		if err := json.Unmarshal(body, &torrents); err != nil {
-			return nil, nil, fmt.Errorf("parsing torrents: %w", err)
-		}
-
-		if len(torrents) == 0 {
-			break
+	// Classify each page as it arrives instead of collecting every torrent first
+	var downloaded []*Torrent
+	var dead []*Torrent
+	total := 0
+	limit := TorrentsPageSize
+
+	err := paginate(c, c.torrentsClient, limit, 1000, func(page int) string {
+		return c.endpoint("torrents?page=" + strconv.Itoa(page+1) + "&limit=" + strconv.Itoa(limit))
+	}, func(page int, torrents []*Torrent) {
+		total += len(torrents)
+		for _, t := range torrents {
+			switch t.Status {
+			case "downloaded":
+				downloaded = append(downloaded, t)
+			case "dead":
+				dead = append(dead, t)
+			}
 		}
-
-		allTorrents = append(allTorrents, torrents...)
 		c.logger.Debug().
-			Int("page", page).
+			Int("page", page+1).
 			Int("count", len(torrents)).
-			Int("total", len(allTorrents)).
+			Int("total", total).
 			Msg("Fetched torrents page")
-
-		if len(torrents) < limit {
-			break
-		}
-
-		page++
-
-		// Safety limit
-		if page > 1000 {
-			c.logger.Warn().Msg("Safety limit reached (1000 pages)")
-			break
-		}
-	}
-
-	// Filter torrents by status
-	var downloaded []*Torrent
-	var dead []*Torrent
-
-	for _, t := range allTorrents {
-		switch t.Status {
-		case "downloaded":
-			downloaded = append(downloaded, t)
-		case "dead":
-			dead = append(dead, t)
-		}
+	})
+	if err != nil {
+		return nil, nil, fmt.Errorf("fetching torrents: %w", err)
 	}
 
 	c.logger.Debug().
-		Int("total", len(allTorrents)).
+		Int("total", total).
 		Int("downloaded", len(downloaded)).
 		Int("dead", len(dead)).
 		Msg("Torrents fetched and filtered")
@@ -101,7 +69,7 @@ func (c *Client) GetTorrents() ([]*Torrent, []*Torrent, error) {
 
 // GetTorrentInfo fetches detailed info for a specific torrent
 func (c *Client) GetTorrentInfo(torrentID string) (*TorrentInfo, error) {
-	url := fmt.Sprintf("%s/torrents/info/%s", c.Host, torrentID)
+	url := c.endpoint("torrents/info/" + torrentID)
 	req, _ := http.NewRequest(http.MethodGet, url, nil)
 
 	resp, err := c.torrentsClient.Do(req)
@@ -119,13 +87,8 @@ func (c *Client) GetTorrentInfo(torrentID string) (*TorrentInfo, error) {
 		return nil, fmt.Errorf("API error: status %d, body: %s", resp.StatusCode, string(body))
 	}
 
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, fmt.Errorf("reading response: %w", err)
-	}
-
 	var info TorrentInfo
-	if err := json.Unmarshal(body, &info); err != nil {
+	if err := json.NewDecoder(resp.Body).Decode(&info); err != nil {
 		return nil, fmt.Errorf("parsing torrent info: %w", err)
 	}
 
@@ -136,7 +99,7 @@ func (c *Client) GetTorrentInfo(torrentID string) (*TorrentInfo, error) {
 func (c *Client) AddMagnet(hash string) (string, error) {
 	magnet := fmt.Sprintf("magnet:?xt=urn:btih:%s", hash)
 
-	url := fmt.Sprintf("%s/torrents/addMagnet", c.Host)
+	url := c.endpoint("torrents/addMagnet")
 	payload := gourl.Values{
 		"magnet": {magnet},
 	}
@@ -170,7 +133,7 @@ func (c *Client) AddMagnet(hash string) (string, error) {
 
 // SelectFiles selects files in a torrent for downloading
 func (c *Client) SelectFiles(torrentID string, fileIDs []string) error {
-	url := fmt.Sprintf("%s/torrents/selectFiles/%s", c.Host, torrentID)
+	url := c.endpoint("torrents/selectFiles/" + torrentID)
 
 	payload := gourl.Values{
 		"files": {strings.Join(fileIDs, ",")},
@@ -205,14 +168,18 @@ func (c *Client) SelectVideoFiles(torrentID string) (int, error) {
 		return 0, err
 	}
 
+	return c.selectVideoFilesFrom(torrentID, info.Files)
+}
+
+// selectVideoFilesFrom selects the video files of an already fetched file list
+func (c *Client) selectVideoFilesFrom(torrentID string, files []File) (int, error) {
+	minSize := c.config.MinFileSizeBytes()
+
 	var videoFileIDs []string
-	for _, f := range info.Files {
-		ext := strings.ToLower(filepath.Ext(f.Path))
-		if ext == ".mkv" || ext == ".mp4" {
-			// Check minimum file size
-			if f.Bytes >= c.config.MinFileSizeBytes() {
-				videoFileIDs = append(videoFileIDs, fmt.Sprintf("%d", f.ID))
-			}
+	for _, f := range files {
+		// Check extension and minimum file size
+		if selectableVideoExts[strings.ToLower(filepath.Ext(f.Path))] && f.Bytes >= minSize {
+			videoFileIDs = append(videoFileIDs, strconv.Itoa(f.ID))
 		}
 	}
 
@@ -229,7 +196,7 @@ func (c *Client) SelectVideoFiles(torrentID string) (int, error) {
 
 // DeleteTorrent deletes a torrent from Real-Debrid
 func (c *Client) DeleteTorrent(torrentID string) error {
-	url := fmt.Sprintf("%s/torrents/delete/%s", c.Host, torrentID)
+	url := c.endpoint("torrents/delete/" + torrentID)
 	req, _ := http.NewRequest(http.MethodDelete, url, nil)
 
 	resp, err := c.torrentsClient.Do(req)
@@ -2,6 +2,7 @@ package realdebrid
 
 import (
 	"encoding/json"
+	"errors"
 	"fmt"
 	"time"
 )
@@ -84,6 +85,36 @@ type TorrentInfo struct {
 	Seeders          int      `json:"seeders,omitempty"`
 }
 
+// ToTorrent converts a TorrentInfo to a Torrent as returned by the torrents list.
+// The torrent is always returned; a non-nil error reports an added or ended
+// date that failed to parse and was left zero. An empty ended date is not an
+// error.
+func (i *TorrentInfo) ToTorrent() (*Torrent, error) {
+	var errs []error
+	added, err := time.Parse(time.RFC3339, i.Added)
+	if err != nil {
+		errs = append(errs, fmt.Errorf("parsing added date: %w", err))
+	}
+	var ended time.Time
+	if i.Ended != "" {
+		if ended, err = time.Parse(time.RFC3339, i.Ended); err != nil {
+			errs = append(errs, fmt.Errorf("parsing ended date: %w", err))
+		}
+	}
+	return &Torrent{
+		ID:       i.ID,
+		Filename: i.Filename,
+		Hash:     i.Hash,
+		Bytes:    i.Bytes,
+		Status:   i.Status,
+		Progress: i.Progress,
+		Added:    added,
+		Ended:    ended,
+		Links:    i.Links,
+		Files:    i.Files,
+	}, errors.Join(errs...)
+}
+
 // AddMagnetResponse is the response from POST /torrents/addMagnet
 type AddMagnetResponse struct {
 	ID  string `json:"id"`
@@ -28,14 +28,14 @@ func (c *Client) UnrestrictLink(link string) (*Download, error) {
 
 	var attempt503, attempt429 int
 
-	for {
-		url := fmt.Sprintf("%s/unrestrict/link", c.Host)
-
-		payload := gourl.Values{
-			"link": {link},
-		}
+	// URL and form body are the same for every attempt
+	url := c.endpoint("unrestrict/link")
+	payload := gourl.Values{
+		"link": {link},
+	}.Encode()
 
-		req, _ := http.NewRequest(http.MethodPost, url, strings.NewReader(payload.Encode()))
+	for {
+		req, _ := http.NewRequest(http.MethodPost, url, strings.NewReader(payload))
 		req.Header.Set("Content-Type", "application/x-www-form-urlencoded")
 
 		resp, err := c.generalClient.Do(req)
@@ -151,7 +151,7 @@ func (c *Client) mapErrorCode(code int, message string) error {
 
 // CheckLink checks if a link is still valid
 func (c *Client) CheckLink(link string) error {
-	url := fmt.Sprintf("%s/unrestrict/check", c.Host)
+	url := c.endpoint("unrestrict/check")
 
 	payload := gourl.Values{
 		"link": {link},
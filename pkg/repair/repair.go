@@ -2,10 +2,12 @@ package repair
 
 import (
 	"fmt"
+	"sync"
 
 	"github.com/robofuse/robofuse/internal/config"
 	"github.com/robofuse/robofuse/internal/logger"
 	"github.com/robofuse/robofuse/pkg/realdebrid"
+	"github.com/robofuse/robofuse/pkg/worker"
 	"github.com/rs/zerolog"
 )
 
@@ -29,6 +31,13 @@ func New(rd *realdebrid.Client, cfg *config.Config) *Service {
 
 // RepairTorrent attempts to repair a dead/failed torrent by reinserting via magnet
 func (s *Service) RepairTorrent(torrent *realdebrid.Torrent, dryRun bool) error {
+	_, err := s.repairTorrent(torrent, dryRun)
+	return err
+}
+
+// repairTorrent reinserts a torrent and returns the ID of the new torrent
+// (empty in dry-run mode)
+func (s *Service) repairTorrent(torrent *realdebrid.Torrent, dryRun bool) (string, error) {
 	s.logger.Info().
 		Str("id", torrent.ID).
 		Str("filename", torrent.Filename).
@@ -37,13 +46,13 @@ func (s *Service) RepairTorrent(torrent *realdebrid.Torrent, dryRun bool) error
 
 	if dryRun {
 		s.logger.Info().Msg("[DRY-RUN] Would repair torrent")
-		return nil
+		return "", nil
 	}
 
 	// Step 1: Add magnet
 	newID, err := s.rd.AddMagnet(torrent.Hash)
 	if err != nil {
-		return fmt.Errorf("adding magnet: %w", err)
+		return "", fmt.Errorf("adding magnet: %w", err)
 	}
 	s.logger.Debug().Str("newId", newID).Msg("Added magnet for repair")
 
@@ -52,7 +61,7 @@ func (s *Service) RepairTorrent(torrent *realdebrid.Torrent, dryRun bool) error
 	if err != nil {
 		// Clean up the new torrent if selection fails
 		s.rd.DeleteTorrent(newID)
-		return fmt.Errorf("selecting video files: %w", err)
+		return "", fmt.Errorf("selecting video files: %w", err)
 	}
 	s.logger.Debug().Int("files", count).Msg("Selected video files")
 
@@ -67,33 +76,60 @@ func (s *Service) RepairTorrent(torrent *realdebrid.Torrent, dryRun bool) error
 		Str("newId", newID).
 		Msg("Torrent repaired successfully")
 
-	return nil
+	return newID, nil
 }
 
-// RepairTorrents repairs multiple torrents
-func (s *Service) RepairTorrents(torrents []*realdebrid.Torrent, dryRun bool) (int, int) {
+// maxRepairWorkers caps concurrent repairs; each repair is a chain of several
+// torrent API calls sharing one rate limit
+const maxRepairWorkers = 8
+
+// RepairTorrents repairs multiple torrents concurrently.
+// Returns the IDs of the reinserted torrents (one per successful repair) and the failure count.
+func (s *Service) RepairTorrents(torrents []*realdebrid.Torrent, dryRun bool) ([]string, int) {
 	if len(torrents) == 0 {
-		return 0, 0
+		return nil, 0
 	}
 
 	s.logger.Info().Int("count", len(torrents)).Msg("Starting torrent repairs")
 
-	var succeeded, failed int
+	// Repairs are independent API round trips; run a few at once and let the
+	// torrents rate limiter pace them
+	workers := s.config.ConcurrentRequests
+	if workers > maxRepairWorkers {
+		workers = maxRepairWorkers
+	}
+
+	var mu sync.Mutex
+	var repairedIDs []string
+	var failed int
+	pool := worker.NewPool(workers)
+
 	for _, t := range torrents {
-		if err := s.RepairTorrent(t, dryRun); err != nil {
-			s.logger.Error().Err(err).Str("filename", t.Filename).Msg("Repair failed")
-			failed++
-		} else {
-			succeeded++
-		}
+		t := t // capture
+		pool.Submit(func() {
+			newID, err := s.repairTorrent(t, dryRun)
+			if err != nil {
+				s.logger.Error().Err(err).Str("filename", t.Filename).Msg("Repair failed")
+			}
+
+			mu.Lock()
+			if err != nil {
+				failed++
+			} else {
+				repairedIDs = append(repairedIDs, newID)
+			}
+			mu.Unlock()
+		})
 	}
 
+	pool.Wait()
+
 	s.logger.Info().
-		Int("succeeded", succeeded).
+		Int("succeeded", len(repairedIDs)).
 		Int("failed", failed).
 		Msg("Torrent repairs completed")
 
-	return succeeded, failed
+	return repairedIDs, failed
 }
 
 // RepairTorrentByHash repairs a torrent using just its hash
@@ -6,6 +6,7 @@ import (
 	"sync"
 	"time"
 
+	"github.com/robofuse/robofuse/internal/fileutil"
 	"github.com/robofuse/robofuse/internal/logger"
 	"github.com/rs/zerolog"
 )
@@ -27,8 +28,10 @@ type RetryItem struct {
 type Queue struct {
 	queueFile string
 	items     []*RetryItem
-	mu        sync.Mutex
-	logger    zerolog.Logger
+	// index maps each queued link to its position in items
+	index  map[string]int
+	mu     sync.Mutex
+	logger zerolog.Logger
 }
 
 // New creates a new retry queue
@@ -36,6 +39,7 @@ func New(queueFile string) *Queue {
 	q := &Queue{
 		queueFile: queueFile,
 		items:     make([]*RetryItem, 0),
+		index:     make(map[string]int),
 		logger:    logger.New("retry"),
 	}
 
@@ -53,17 +57,16 @@ func (q *Queue) Add(link, torrentID, filename, errorType, errorMsg string) {
 	defer q.mu.Unlock()
 
 	// Check if link already exists
-	for _, item := range q.items {
-		if item.Link == link {
-			// Already in queue, increment retry count
-			item.RetryCount++
-			item.LastError = errorMsg
-			q.logger.Debug().
-				Str("link", link).
-				Int("retryCount", item.RetryCount).
-				Msg("Updated existing retry item")
-			return
-		}
+	if i, ok := q.index[link]; ok {
+		// Already in queue, increment retry count
+		item := q.items[i]
+		item.RetryCount++
+		item.LastError = errorMsg
+		q.logger.Debug().
+			Str("link", link).
+			Int("retryCount", item.RetryCount).
+			Msg("Updated existing retry item")
+		return
 	}
 
 	// Add new item
@@ -77,6 +80,7 @@ func (q *Queue) Add(link, torrentID, filename, errorType, errorMsg string) {
 		ErrorType:  errorType,
 	}
 
+	q.index[link] = len(q.items)
 	q.items = append(q.items, item)
 	q.logger.Info().
 		Str("link", link).
@@ -101,15 +105,18 @@ func (q *Queue) Remove(link string) {
 	q.mu.Lock()
 	defer q.mu.Unlock()
 
-	for i, item := range q.items {
-		if item.Link == link {
-			// Remove by replacing with last element and truncating
-			q.items[i] = q.items[len(q.items)-1]
-			q.items = q.items[:len(q.items)-1]
-			q.logger.Debug().Str("link", link).Msg("Removed from retry queue")
-			return
-		}
+	i, ok := q.index[link]
+	if !ok {
+		return
 	}
+
+	// Remove by replacing with last element and truncating
+	last := q.items[len(q.items)-1]
+	q.items[i] = last
+	q.index[last.Link] = i
+	q.items = q.items[:len(q.items)-1]
+	delete(q.index, link)
+	q.logger.Debug().Str("link", link).Msg("Removed from retry queue")
 }
 
 // IncrementRetry increments the retry count for a link
@@ -117,15 +124,13 @@ func (q *Queue) IncrementRetry(link string) {
 	q.mu.Lock()
 	defer q.mu.Unlock()
 
-	for _, item := range q.items {
-		if item.Link == link {
-			item.RetryCount++
-			q.logger.Debug().
-				Str("link", link).
-				Int("retryCount", item.RetryCount).
-				Msg("Incremented retry count")
-			return
-		}
+	if i, ok := q.index[link]; ok {
+		item := q.items[i]
+		item.RetryCount++
+		q.logger.Debug().
+			Str("link", link).
+			Int("retryCount", item.RetryCount).
+			Msg("Incremented retry count")
 	}
 }
 
@@ -134,12 +139,8 @@ func (q *Queue) Save() error {
 	q.mu.Lock()
 	defer q.mu.Unlock()
 
-	data, err := json.MarshalIndent(q.items, "", "  ")
-	if err != nil {
-		return err
-	}
-
-	if err := os.WriteFile(q.queueFile, data, 0644); err != nil {
+	// Compact JSON, written atomically so a crash never leaves a truncated file
+	if err := fileutil.WriteJSONAtomic(q.queueFile, q.items, 0644); err != nil {
 		return err
 	}
 
@@ -157,10 +158,26 @@ func (q *Queue) Load() error {
 	q.mu.Lock()
 	defer q.mu.Unlock()
 
-	if err := json.Unmarshal(data, &q.items); err != nil {
+	var items []*RetryItem
+	if err := json.Unmarshal(data, &items); err != nil {
 		return err
 	}
 
+	// Rebuild the link index; Add never queues a link twice, so keep only
+	// the first entry should the file hold duplicates
+	q.items = make([]*RetryItem, 0, len(items))
+	q.index = make(map[string]int, len(items))
+	for _, item := range items {
+		if item == nil {
+			continue
+		}
+		if _, dup := q.index[item.Link]; dup {
+			continue
+		}
+		q.index[item.Link] = len(q.items)
+		q.items = append(q.items, item)
+	}
+
 	q.logger.Debug().Int("count", len(q.items)).Msg("Loaded retry queue")
 	return nil
 }
@@ -179,5 +196,6 @@ func (q *Queue) Clear() {
 	defer q.mu.Unlock()
 
 	q.items = make([]*RetryItem, 0)
+	q.index = make(map[string]int)
 	q.logger.Info().Msg("Cleared retry queue")
 }
@@ -0,0 +1,115 @@
+package retry
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+)
+
+// retry_test.go verifies queue ordering and the link index across operations.
+
+// assertQueue checks the queued links in order and that the index matches them
+func assertQueue(t *testing.T, q *Queue, want ...string) {
+	t.Helper()
+	items := q.GetAll()
+	if len(items) != len(want) {
+		t.Fatalf("queue has %d items, want %d", len(items), len(want))
+	}
+	for i, item := range items {
+		if item.Link != want[i] {
+			t.Fatalf("item %d is %q, want %q", i, item.Link, want[i])
+		}
+		if q.index[item.Link] != i {
+			t.Fatalf("index[%q] = %d, want %d", item.Link, q.index[item.Link], i)
+		}
+	}
+	if len(q.index) != len(want) {
+		t.Fatalf("index has %d links, want %d", len(q.index), len(want))
+	}
+}
+
+func TestQueue_AddRemoveKeepsIndex(t *testing.T) {
+	q := New(filepath.Join(t.TempDir(), "retry_queue.json"))
+
+	for _, link := range []string{"a", "b", "c", "d"} {
+		q.Add(link, "torrent-"+link, link+".mkv", "503", "unavailable")
+	}
+	assertQueue(t, q, "a", "b", "c", "d")
+
+	// The last item moves into the gap
+	q.Remove("b")
+	assertQueue(t, q, "a", "d", "c")
+
+	q.Remove("missing")
+	assertQueue(t, q, "a", "d", "c")
+
+	// Removing the last item moves nothing
+	q.Remove("c")
+	assertQueue(t, q, "a", "d")
+
+	q.Remove("a")
+	q.Add("e", "torrent-e", "e.mkv", "503", "unavailable")
+	assertQueue(t, q, "d", "e")
+
+	q.Remove("e")
+	q.Remove("d")
+	assertQueue(t, q)
+	q.Add("f", "torrent-f", "f.mkv", "503", "unavailable")
+	assertQueue(t, q, "f")
+
+	q.Clear()
+	assertQueue(t, q)
+
+	q.Clear()
+	assertQueue(t, q)
+}
+
+func TestQueue_AddAndIncrementExistingLink(t *testing.T) {
+	q := New(filepath.Join(t.TempDir(), "retry_queue.json"))
+
+	q.Add("a", "torrent-a", "a.mkv", "503", "first")
+	q.Add("b", "torrent-b", "b.mkv", "503", "first")
+	q.Add("a", "torrent-a", "a.mkv", "503", "second")
+	q.IncrementRetry("a")
+	q.IncrementRetry("missing")
+
+	assertQueue(t, q, "a", "b")
+	item := q.GetAll()[0]
+	if item.RetryCount != 2 || item.LastError != "second" {
+		t.Fatalf("item a = %+v, want retry count 2 and last error %q", item, "second")
+	}
+}
+
+func TestQueue_LoadRebuildsIndexAndDropsDuplicates(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "retry_queue.json")
+	data := `[
+		{"link": "a", "retry_count": 1},
+		{"link": "b", "retry_count": 2},
+		{"link": "a", "retry_count": 3},
+		{"link": "c", "retry_count": 4}
+	]`
+	if err := os.WriteFile(path, []byte(data), 0644); err != nil {
+		t.Fatalf("write queue: %v", err)
+	}
+
+	q := New(path)
+	assertQueue(t, q, "a", "b", "c")
+	if got := q.GetAll()[0].RetryCount; got != 1 {
+		t.Fatalf("kept duplicate has retry count %d, want the first entry's 1", got)
+	}
+
+	q.Remove("a")
+	assertQueue(t, q, "c", "b")
+}
+
+func TestQueue_SaveLoadRoundTrip(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "retry_queue.json")
+	q := New(path)
+	q.Add("a", "torrent-a", "a.mkv", "503", "unavailable")
+	q.Add("b", "torrent-b", "b.mkv", "503", "unavailable")
+	if err := q.Save(); err != nil {
+		t.Fatalf("save: %v", err)
+	}
+
+	assertQueue(t, New(path), "a", "b")
+}
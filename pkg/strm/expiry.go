@@ -1,7 +1,6 @@
 package strm
 
 import (
-	"os"
 	"path/filepath"
 	"time"
 
@@ -15,23 +14,30 @@ func (s *Service) GetExpiredFiles(olderThan time.Duration) []*tracking.FileTrack
 	return s.tracking.GetExpired(olderThan)
 }
 
-// UpdateSTRM updates an existing STRM file with a new URL and refreshes tracking
+// UpdateSTRM updates an existing STRM file with a new URL and refreshes tracking.
+// It is safe for concurrent use; call SaveTracking once the batch is done.
 func (s *Service) UpdateSTRM(relativePath, newURL, link, torrentID string) error {
 	fullPath := filepath.Join(s.config.OutputDir, relativePath)
 
 	// Write new URL to STRM file
-	if err := os.WriteFile(fullPath, []byte(newURL), 0644); err != nil {
+	if err := writeSTRM(fullPath, newURL); err != nil {
 		return err
 	}
 
 	// Update tracking with new URL and refresh timestamp
 	s.tracking.Track(relativePath, newURL, link, torrentID)
-
-	// Save tracking data
-	if err := s.tracking.Save(); err != nil {
-		s.logger.Warn().Err(err).Msg("Failed to save tracking  after update")
-	}
+	s.markVerified(relativePath, newURL)
 
 	s.logger.Debug().Str("path", relativePath).Msg("Refreshed STRM file")
 	return nil
 }
+
+// SaveTracking persists tracking data after a batch of UpdateSTRM calls
+func (s *Service) SaveTracking() error {
+	return s.tracking.Save()
+}
+
+// ForEachTracked calls fn for every tracked STRM file
+func (s *Service) ForEachTracked(fn func(relativePath string, tracking *tracking.FileTracking)) {
+	s.tracking.ForEach(fn)
+}
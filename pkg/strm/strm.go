@@ -1,16 +1,21 @@
 package strm
 
 import (
+	"hash/fnv"
+	"io/fs"
 	"os"
 	"path/filepath"
 	"regexp"
+	"sort"
 	"strconv"
 	"strings"
+	"sync"
 
 	"github.com/robofuse/robofuse/internal/config"
 	"github.com/robofuse/robofuse/internal/logger"
 	"github.com/robofuse/robofuse/pkg/realdebrid"
 	"github.com/robofuse/robofuse/pkg/tracking"
+	"github.com/robofuse/robofuse/pkg/worker"
 	"github.com/rs/zerolog"
 )
 
@@ -21,14 +26,31 @@ type Service struct {
 	config   *config.Config
 	logger   zerolog.Logger
 	tracking *tracking.Service
+	// sanitized memoizes sanitizeFilename; folder names repeat for every file
+	// of a release and stay the same across watch cycles
+	sanitized map[string]string
+	// knownDirs holds output folders known to exist, so repeat writes across
+	// watch cycles skip MkdirAll; cleanupEmptyDirs drops removed folders
+	knownDirs map[string]struct{}
+	dirsMu    sync.Mutex
+	// verified holds hashes of (path, URL) pairs confirmed on disk by the
+	// last scan or written since, letting watch cycles skip the mtime stat
+	verified   map[uint64]struct{}
+	verifiedMu sync.Mutex
 }
 
+// maxSanitizedCache bounds the sanitizeFilename memo
+const maxSanitizedCache = 4096
+
 // New creates a new STRM service
 func New(cfg *config.Config) *Service {
 	return &Service{
-		config:   cfg,
-		logger:   logger.New("strm"),
-		tracking: tracking.New(cfg.TrackingFile),
+		config:    cfg,
+		logger:    logger.New("strm"),
+		tracking:  tracking.New(cfg.TrackingFile),
+		sanitized: make(map[string]string),
+		knownDirs: make(map[string]struct{}),
+		verified:  make(map[uint64]struct{}),
 	}
 }
 
@@ -68,6 +90,7 @@ func (s *Service) Sync(candidates []realdebrid.STRMCandidate, dryRun bool) (*Syn
 	}
 
 	// Step 3: Process candidates (add/update)
+	var writes []pendingWrite
 	for path, url := range expected {
 		existingURL, exists := existing[path]
 
@@ -77,30 +100,24 @@ func (s *Service) Sync(candidates []realdebrid.STRMCandidate, dryRun bool) (*Syn
 			} else {
 				// Different URL - update
 				result.Updated++
-				if !dryRun {
-					if err := s.writeSTRM(path, url); err != nil {
-						s.logger.Error().Err(err).Str("path", path).Msg("Failed to update STRM")
-					} else {
-						// Track the update
-						candidate := candidateMap[path]
-						s.tracking.Track(path, url, candidate.Link, candidate.TorrentID)
-					}
-				}
-				s.logger.Debug().Str("path", path).Msg("Updated STRM")
+				writes = append(writes, pendingWrite{path: path, url: url, update: true})
 			}
 		} else {
 			// New file
 			result.Added++
-			if !dryRun {
-				if err := s.writeSTRM(path, url); err != nil {
-					s.logger.Error().Err(err).Str("path", path).Msg("Failed to create STRM")
-				} else {
-					// Track the new file
-					candidate := candidateMap[path]
-					s.tracking.Track(path, url, candidate.Link, candidate.TorrentID)
-				}
+			writes = append(writes, pendingWrite{path: path, url: url})
+		}
+	}
+
+	if !dryRun {
+		s.writeAll(writes, candidateMap)
+	} else {
+		for _, w := range writes {
+			if w.update {
+				s.logger.Debug().Str("path", w.path).Msg("Updated STRM")
+			} else {
+				s.logger.Debug().Str("path", w.path).Msg("Created STRM")
 			}
-			s.logger.Debug().Str("path", path).Msg("Created STRM")
 		}
 	}
 
@@ -144,34 +161,55 @@ func (s *Service) Sync(candidates []realdebrid.STRMCandidate, dryRun bool) (*Syn
 	return result, nil
 }
 
-// scanExisting scans the output directory for existing STRM files
+// scanExisting scans the output directory for existing STRM files.
+// Files whose modification time is not after their tracking timestamp are
+// taken from tracking instead of being read. Files verified by the previous
+// scan or written since are taken from tracking without a stat.
 func (s *Service) scanExisting() (map[string]string, error) {
 	existing := make(map[string]string)
+	var toRead []strmFile
 
-	err := filepath.Walk(s.config.OutputDir, func(path string, info os.FileInfo, err error) error {
+	s.verifiedMu.Lock()
+	previous := s.verified
+	s.verifiedMu.Unlock()
+	verified := make(map[uint64]struct{}, len(previous))
+
+	// WalkDir gets entry types from the directory listing, so only .strm files are stat'ed
+	err := filepath.WalkDir(s.config.OutputDir, func(path string, d fs.DirEntry, err error) error {
 		if err != nil {
 			return nil // Skip errors
 		}
-		if info.IsDir() {
+		if d.IsDir() {
 			return nil
 		}
-		if !strings.HasSuffix(strings.ToLower(path), ".strm") {
+		name := d.Name()
+		if len(name) < len(".strm") || !strings.EqualFold(name[len(name)-len(".strm"):], ".strm") {
 			return nil
 		}
 
-		// Read content
-		content, err := os.ReadFile(path)
-		if err != nil {
-			return nil // Skip unreadable files
-		}
-
 		// Get relative path
 		relPath, err := filepath.Rel(s.config.OutputDir, path)
 		if err != nil {
 			return nil
 		}
 
-		existing[relPath] = strings.TrimSpace(string(content))
+		if tracked, ok := s.tracking.Get(relPath); ok && tracked.DownloadURL != "" {
+			key := pairKey(relPath, tracked.DownloadURL)
+			if _, hit := previous[key]; hit {
+				verified[key] = struct{}{}
+				existing[relPath] = tracked.DownloadURL
+				return nil
+			}
+
+			// Files not modified since we last wrote them still hold the tracked URL
+			if info, err := d.Info(); err == nil && !info.ModTime().After(tracked.LastChecked) {
+				verified[key] = struct{}{}
+				existing[relPath] = tracked.DownloadURL
+				return nil
+			}
+		}
+
+		toRead = append(toRead, strmFile{fullPath: path, relPath: relPath})
 		return nil
 	})
 
@@ -179,45 +217,228 @@ func (s *Service) scanExisting() (map[string]string, error) {
 		return nil, err
 	}
 
+	// Read the remaining files in parallel; on slow or network storage the
+	// reads dominate the scan
+	contents := make([]string, len(toRead))
+	readOK := make([]bool, len(toRead))
+	pool := worker.NewPool(maxScanReaders)
+	for i, f := range toRead {
+		i, f := i, f // capture
+		pool.Submit(func() {
+			content, err := os.ReadFile(f.fullPath)
+			if err != nil {
+				return // Skip unreadable files
+			}
+			contents[i] = strings.TrimSpace(string(content))
+			readOK[i] = true
+		})
+	}
+	pool.Wait()
+
+	for i, f := range toRead {
+		if readOK[i] {
+			existing[f.relPath] = contents[i]
+			verified[pairKey(f.relPath, contents[i])] = struct{}{}
+		}
+	}
+
+	// Replace rather than merge, so pairs for changed or removed files drop out
+	s.verifiedMu.Lock()
+	s.verified = verified
+	s.verifiedMu.Unlock()
+
 	return existing, nil
 }
 
+// pairKey hashes a STRM path together with its URL
+func pairKey(relPath, url string) uint64 {
+	h := fnv.New64a()
+	h.Write([]byte(relPath))
+	h.Write([]byte{0})
+	h.Write([]byte(url))
+	return h.Sum64()
+}
+
+// markVerified records that relPath now holds url on disk
+func (s *Service) markVerified(relPath, url string) {
+	key := pairKey(relPath, url)
+	s.verifiedMu.Lock()
+	s.verified[key] = struct{}{}
+	s.verifiedMu.Unlock()
+}
+
+// maxScanReaders bounds concurrent STRM reads during scanExisting
+const maxScanReaders = 16
+
+// strmFile is an existing STRM file whose content has to be read
+type strmFile struct {
+	fullPath string
+	relPath  string
+}
+
 // buildSTRMPath builds the relative path for a STRM file
 func (s *Service) buildSTRMPath(folderName, filename string) string {
-	folder := sanitizeFilename(folderName)
-	file := sanitizeFilename(filename)
+	folder := s.sanitize(folderName)
+	file := s.sanitize(filename)
 
 	// Change extension to .strm
 	ext := filepath.Ext(file)
 	strmName := strings.TrimSuffix(file, ext) + ".strm"
 
-	return filepath.Join(folder, strmName)
+	// Sanitized names contain no separators, so a plain join is already clean;
+	// only empty or dot folders need filepath.Join to normalize them
+	if folder == "" || folder == "." || folder == ".." {
+		return filepath.Join(folder, strmName)
+	}
+	return folder + string(filepath.Separator) + strmName
+}
+
+// pendingWrite is a STRM file to create or update
+type pendingWrite struct {
+	path   string
+	url    string
+	update bool
+}
+
+// writeAll writes STRM files grouped by folder, creating each folder once,
+// and tracks every file that was written successfully. Folders are written
+// in parallel on a worker pool.
+func (s *Service) writeAll(writes []pendingWrite, candidateMap map[string]realdebrid.STRMCandidate) {
+	// Sorting by path keeps the files of a folder next to each other
+	sort.Slice(writes, func(i, j int) bool { return writes[i].path < writes[j].path })
+
+	pool := worker.NewPool(s.config.ConcurrentRequests)
+	for start := 0; start < len(writes); {
+		dir := filepath.Dir(writes[start].path)
+		end := start + 1
+		for end < len(writes) && filepath.Dir(writes[end].path) == dir {
+			end++
+		}
+
+		group := writes[start:end]
+		pool.Submit(func() {
+			s.writeFolder(dir, group, candidateMap)
+		})
+		start = end
+	}
+	pool.Wait()
+}
+
+// writeFolder creates one folder and writes its STRM files
+func (s *Service) writeFolder(dir string, writes []pendingWrite, candidateMap map[string]realdebrid.STRMCandidate) {
+	fullDir := filepath.Join(s.config.OutputDir, dir)
+	dirErr := s.ensureDir(fullDir)
+
+	for _, w := range writes {
+		err := dirErr
+		if err == nil {
+			fullPath := fullDir + string(filepath.Separator) + filepath.Base(w.path)
+			err = writeSTRM(fullPath, w.url)
+			if os.IsNotExist(err) {
+				// Folder was removed behind our back; recreate it once
+				s.forgetDir(fullDir)
+				if err = s.ensureDir(fullDir); err == nil {
+					err = writeSTRM(fullPath, w.url)
+				}
+			}
+		}
+
+		if err != nil {
+			if w.update {
+				s.logger.Error().Err(err).Str("path", w.path).Msg("Failed to update STRM")
+			} else {
+				s.logger.Error().Err(err).Str("path", w.path).Msg("Failed to create STRM")
+			}
+		} else {
+			candidate := candidateMap[w.path]
+			s.tracking.Track(w.path, w.url, candidate.Link, candidate.TorrentID)
+			s.markVerified(w.path, w.url)
+		}
+
+		if w.update {
+			s.logger.Debug().Str("path", w.path).Msg("Updated STRM")
+		} else {
+			s.logger.Debug().Str("path", w.path).Msg("Created STRM")
+		}
+	}
+}
+
+// writeSTRM writes a STRM file with the given URL. The parent directory must exist.
+// The URL goes to a temp file that is renamed into place, so media servers
+// scanning the library never read a half-written file.
+func writeSTRM(fullPath, url string) error {
+	tmpPath := fullPath + ".tmp"
+	if err := os.WriteFile(tmpPath, []byte(url), 0644); err != nil {
+		return err
+	}
+	if err := os.Rename(tmpPath, fullPath); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+	return nil
 }
 
-// writeSTRM writes a STRM file with the given URL
-func (s *Service) writeSTRM(relativePath, url string) error {
-	fullPath := filepath.Join(s.config.OutputDir, relativePath)
+// ensureDir creates an output folder unless it is already known to exist
+func (s *Service) ensureDir(fullDir string) error {
+	s.dirsMu.Lock()
+	_, known := s.knownDirs[fullDir]
+	s.dirsMu.Unlock()
+	if known {
+		return nil
+	}
 
-	// Ensure parent directory exists
-	if err := os.MkdirAll(filepath.Dir(fullPath), 0755); err != nil {
+	if err := os.MkdirAll(fullDir, 0755); err != nil {
 		return err
 	}
 
-	return os.WriteFile(fullPath, []byte(url), 0644)
+	s.dirsMu.Lock()
+	s.knownDirs[fullDir] = struct{}{}
+	s.dirsMu.Unlock()
+	return nil
+}
+
+// forgetDir drops a folder from the known set after it was removed
+func (s *Service) forgetDir(fullDir string) {
+	s.dirsMu.Lock()
+	delete(s.knownDirs, fullDir)
+	s.dirsMu.Unlock()
 }
 
 // cleanupEmptyDirs removes empty directories up to the output root
 func (s *Service) cleanupEmptyDirs(dir string) {
+	// Removing a non-empty directory fails, so no listing is needed. os.Remove
+	// would unlink a symlinked folder whatever its target holds, so stop there.
 	for dir != s.config.OutputDir && dir != "" && dir != "." {
-		entries, err := os.ReadDir(dir)
-		if err != nil || len(entries) > 0 {
+		if info, err := os.Lstat(dir); err != nil || !info.IsDir() {
 			break
 		}
-		os.Remove(dir)
+		if err := os.Remove(dir); err != nil {
+			break
+		}
+		s.forgetDir(dir)
 		dir = filepath.Dir(dir)
 	}
 }
 
+// sanitize returns sanitizeFilename(name), memoized. Not safe for concurrent use.
+func (s *Service) sanitize(name string) string {
+	if cleaned, ok := s.sanitized[name]; ok {
+		return cleaned
+	}
+	if len(s.sanitized) >= maxSanitizedCache {
+		clear(s.sanitized)
+	}
+	cleaned := sanitizeFilename(name)
+	s.sanitized[name] = cleaned
+	return cleaned
+}
+
+// invalidCharsReplacer replaces characters that are invalid in filenames
+var invalidCharsReplacer = strings.NewReplacer(
+	"/", "_", "\\", "_", ":", "_", "*", "_",
+	"?", "_", "\"", "_", "<", "_", ">", "_", "|", "_",
+)
+
 // sanitizeFilename makes a filename safe for the filesystem with enhanced cleaning
 func sanitizeFilename(name string) string {
 	// Step 1: Multi-pass URL decoding (up to 3 times)
@@ -272,11 +493,7 @@ func sanitizeFilename(name string) string {
 	}
 
 	// Step 7: Replace invalid filesystem characters
-	replacer := strings.NewReplacer(
-		"/", "_", "\\", "_", ":", "_", "*", "_",
-		"?", "_", "\"", "_", "<", "_", ">", "_", "|", "_",
-	)
-	baseName = replacer.Replace(baseName)
+	baseName = invalidCharsReplacer.Replace(baseName)
 
 	// Step 8: Trim whitespace
 	baseName = strings.TrimSpace(baseName)
@@ -299,10 +516,14 @@ func urlDecode(s string) string {
 	return decoded
 }
 
+// sitePrefixRegex matches common site prefixes: hhd001.com@, hdd123.com@, etc.
+var sitePrefixRegex = regexp.MustCompile(`^(hhd\d+\.com@|hdd\d+\.com@|www\.[\w-]+\.com@|[\w-]+\.com@)`)
+
 // removeSitePrefixes removes common site prefixes from filenames
 func removeSitePrefixes(s string) string {
-	// Common patterns: hhd001.com@, hdd123.com@, etc.
-	prefixPattern := `^(hhd\d+\.com@|hdd\d+\.com@|www\.[\w-]+\.com@|[\w-]+\.com@)`
-	re := regexp.MustCompile(prefixPattern)
-	return re.ReplaceAllString(s, "")
+	// Every prefix ends in ".com@", skip the regex for names without one
+	if !strings.Contains(s, ".com@") {
+		return s
+	}
+	return sitePrefixRegex.ReplaceAllString(s, "")
 }
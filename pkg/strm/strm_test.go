@@ -0,0 +1,183 @@
+package strm
+
+import (
+	"maps"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/robofuse/robofuse/internal/config"
+)
+
+// strm_test.go verifies the STRM scan shortcuts and folder cleanup.
+
+// newScanService returns a service writing to a fresh output directory
+func newScanService(t *testing.T) *Service {
+	t.Helper()
+	base := t.TempDir()
+	return New(&config.Config{
+		OutputDir:    filepath.Join(base, "library"),
+		TrackingFile: filepath.Join(base, "file_tracking.json"),
+	})
+}
+
+// writeSTRMAt writes a STRM file under the output directory with the given mtime
+func writeSTRMAt(t *testing.T, s *Service, relPath, url string, mtime time.Time) {
+	t.Helper()
+	fullPath := filepath.Join(s.config.OutputDir, relPath)
+	if err := os.MkdirAll(filepath.Dir(fullPath), 0755); err != nil {
+		t.Fatalf("mkdir: %v", err)
+	}
+	if err := os.WriteFile(fullPath, []byte(url+"\n"), 0644); err != nil {
+		t.Fatalf("write: %v", err)
+	}
+	if err := os.Chtimes(fullPath, mtime, mtime); err != nil {
+		t.Fatalf("chtimes: %v", err)
+	}
+}
+
+func scan(t *testing.T, s *Service) map[string]string {
+	t.Helper()
+	existing, err := s.scanExisting()
+	if err != nil {
+		t.Fatalf("scanExisting: %v", err)
+	}
+	return existing
+}
+
+func TestScanExisting_MtimeShortcut(t *testing.T) {
+	rel := filepath.Join("Show", "Episode.strm")
+	cases := []struct {
+		name  string
+		mtime time.Duration // relative to the tracking timestamp
+		want  string
+	}{
+		// Untouched since tracked: the tracked URL is used without reading
+		{name: "unchanged file uses tracking", mtime: -time.Hour, want: "tracked-url"},
+		// Modified after tracking: the file is read
+		{name: "modified file is read", mtime: time.Hour, want: "disk-url"},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.name, func(t *testing.T) {
+			s := newScanService(t)
+			s.tracking.Track(rel, "tracked-url", "link", "torrent")
+			tracked, _ := s.tracking.Get(rel)
+			writeSTRMAt(t, s, rel, "disk-url", tracked.LastChecked.Add(tc.mtime))
+
+			if got := scan(t, s)[rel]; got != tc.want {
+				t.Fatalf("scanned URL = %q, want %q", got, tc.want)
+			}
+		})
+	}
+}
+
+func TestScanExisting_UntrackedFileIsRead(t *testing.T) {
+	s := newScanService(t)
+	rel := filepath.Join("Show", "Episode.strm")
+	writeSTRMAt(t, s, rel, "disk-url", time.Now().Add(-time.Hour))
+
+	if got := scan(t, s)[rel]; got != "disk-url" {
+		t.Fatalf("scanned URL = %q, want %q", got, "disk-url")
+	}
+}
+
+func TestScanExisting_VerifiedShortcut(t *testing.T) {
+	s := newScanService(t)
+	rel := filepath.Join("Show", "Episode.strm")
+	s.tracking.Track(rel, "tracked-url", "link", "torrent")
+	tracked, _ := s.tracking.Get(rel)
+	writeSTRMAt(t, s, rel, "disk-url", tracked.LastChecked.Add(-time.Hour))
+
+	// The first scan verifies the pair through the mtime check
+	if got := scan(t, s)[rel]; got != "tracked-url" {
+		t.Fatalf("first scan URL = %q, want %q", got, "tracked-url")
+	}
+
+	// A verified pair is trusted without a stat, even if the mtime moves
+	writeSTRMAt(t, s, rel, "disk-url", tracked.LastChecked.Add(time.Hour))
+	if got := scan(t, s)[rel]; got != "tracked-url" {
+		t.Fatalf("verified scan URL = %q, want %q", got, "tracked-url")
+	}
+
+	// A new tracked URL is a different pair, so the file is checked again
+	s.tracking.Track(rel, "newer-url", "link", "torrent")
+	writeSTRMAt(t, s, rel, "disk-url", time.Now().Add(time.Hour))
+	if got := scan(t, s)[rel]; got != "disk-url" {
+		t.Fatalf("scan after URL change = %q, want %q", got, "disk-url")
+	}
+}
+
+func TestScanExisting_DropsRemovedFilesFromVerified(t *testing.T) {
+	s := newScanService(t)
+	rel := filepath.Join("Show", "Episode.strm")
+	s.tracking.Track(rel, "tracked-url", "link", "torrent")
+	tracked, _ := s.tracking.Get(rel)
+	writeSTRMAt(t, s, rel, "tracked-url", tracked.LastChecked.Add(-time.Hour))
+
+	scan(t, s)
+	if _, ok := s.verified[pairKey(rel, "tracked-url")]; !ok {
+		t.Fatalf("scanned pair was not verified")
+	}
+
+	if err := os.Remove(filepath.Join(s.config.OutputDir, rel)); err != nil {
+		t.Fatalf("remove: %v", err)
+	}
+	if existing := scan(t, s); len(existing) != 0 {
+		t.Fatalf("removed file still scanned: %v", existing)
+	}
+	if len(s.verified) != 0 {
+		t.Fatalf("verified set kept %d pairs for removed files", len(s.verified))
+	}
+}
+
+func TestScanExisting_FiltersEntries(t *testing.T) {
+	s := newScanService(t)
+	old := time.Now().Add(-time.Hour)
+	writeSTRMAt(t, s, filepath.Join("Show", "Upper.STRM"), "upper-url", old)
+	writeSTRMAt(t, s, filepath.Join("Show", "notes.txt"), "ignored", old)
+	// Titles such as ".hack" keep their leading dot after sanitizing
+	writeSTRMAt(t, s, filepath.Join(".hack Sign (2002)", "Episode.strm"), "dot-url", old)
+
+	want := map[string]string{
+		filepath.Join("Show", "Upper.STRM"):                "upper-url",
+		filepath.Join(".hack Sign (2002)", "Episode.strm"): "dot-url",
+	}
+	if existing := scan(t, s); !maps.Equal(existing, want) {
+		t.Fatalf("scanned %v, want %v", existing, want)
+	}
+}
+
+func TestScanExisting_MissingOutputDir(t *testing.T) {
+	s := newScanService(t)
+	if existing := scan(t, s); len(existing) != 0 {
+		t.Fatalf("scanned %v from a missing output directory", existing)
+	}
+}
+
+func TestCleanupEmptyDirs_KeepsSymlinkedFolder(t *testing.T) {
+	s := newScanService(t)
+	target := filepath.Join(t.TempDir(), "Movies")
+	emptied := filepath.Join(target, "Film (2020)")
+	if err := os.MkdirAll(emptied, 0755); err != nil {
+		t.Fatalf("mkdir: %v", err)
+	}
+	if err := os.MkdirAll(s.config.OutputDir, 0755); err != nil {
+		t.Fatalf("mkdir output: %v", err)
+	}
+	link := filepath.Join(s.config.OutputDir, "Movies")
+	if err := os.Symlink(target, link); err != nil {
+		t.Skipf("symlinks not supported: %v", err)
+	}
+
+	s.cleanupEmptyDirs(filepath.Join(link, "Film (2020)"))
+
+	if _, err := os.Stat(emptied); !os.IsNotExist(err) {
+		t.Fatalf("empty folder inside the link was kept: %v", err)
+	}
+	// The link stays even though its target is now empty
+	if info, err := os.Lstat(link); err != nil || info.Mode()&os.ModeSymlink == 0 {
+		t.Fatalf("symlinked folder was removed: %v", err)
+	}
+}
@@ -7,42 +7,45 @@ import (
 
 // file_types.go defines extension filters used by sync categorization.
 
-// Video extensions
-var videoExtensions = map[string]bool{
-	".mkv":  true,
-	".mp4":  true,
-	".avi":  true,
-	".mov":  true,
-	".wmv":  true,
-	".flv":  true,
-	".m4v":  true,
-	".webm": true,
-	".mpg":  true,
-	".mpeg": true,
-	".ts":   true,
-	".m2ts": true,
-}
+// fileKind is the category of a file as decided by its extension
+type fileKind uint8
 
-// Subtitle extensions
-var subtitleExtensions = map[string]bool{
-	".srt": true,
-	".ass": true,
-	".ssa": true,
-	".vtt": true,
-	".sub": true,
-	".idx": true,
-	".smi": true,
-	".sbv": true,
-}
+const (
+	kindOther fileKind = iota
+	kindVideo
+	kindSubtitle
+)
+
+// fileKinds maps lowercase extensions to their kind, so a file is
+// classified with a single lookup
+var fileKinds = map[string]fileKind{
+	// Video extensions
+	".mkv":  kindVideo,
+	".mp4":  kindVideo,
+	".avi":  kindVideo,
+	".mov":  kindVideo,
+	".wmv":  kindVideo,
+	".flv":  kindVideo,
+	".m4v":  kindVideo,
+	".webm": kindVideo,
+	".mpg":  kindVideo,
+	".mpeg": kindVideo,
+	".ts":   kindVideo,
+	".m2ts": kindVideo,
 
-// isVideo checks if a filename is a video file
-func isVideo(filename string) bool {
-	ext := strings.ToLower(filepath.Ext(filename))
-	return videoExtensions[ext]
+	// Subtitle extensions
+	".srt": kindSubtitle,
+	".ass": kindSubtitle,
+	".ssa": kindSubtitle,
+	".vtt": kindSubtitle,
+	".sub": kindSubtitle,
+	".idx": kindSubtitle,
+	".smi": kindSubtitle,
+	".sbv": kindSubtitle,
 }
 
-// isSubtitle checks if a filename is a subtitle file
-func isSubtitle(filename string) bool {
-	ext := strings.ToLower(filepath.Ext(filename))
-	return subtitleExtensions[ext]
+// classifyFile reports whether a filename is a video or a subtitle file
+func classifyFile(filename string) (isVideo, isSubtitle bool) {
+	kind := fileKinds[strings.ToLower(filepath.Ext(filename))]
+	return kind == kindVideo, kind == kindSubtitle
 }
@@ -3,9 +3,11 @@ package sync
 import (
 	"errors"
 	"net/http"
+	"sync"
 
 	"github.com/robofuse/robofuse/internal/request"
 	"github.com/robofuse/robofuse/pkg/realdebrid"
+	"github.com/robofuse/robofuse/pkg/worker"
 )
 
 // retry_handler.go processes queued retry items across sync cycles.
@@ -33,6 +35,8 @@ func (s *Service) processRetryQueue(torrents []*realdebrid.Torrent) *RetryStats
 	}
 
 	stats := &RetryStats{}
+	var mu sync.Mutex
+	pool := worker.NewPool(s.config.ConcurrentRequests)
 
 	for _, item := range items {
 		// Check if max retries exceeded
@@ -56,42 +60,51 @@ func (s *Service) processRetryQueue(torrents []*realdebrid.Torrent) *RetryStats
 			continue
 		}
 
-		// Attempt to unrestrict the link
-		s.logger.Debug().
-			Str("link", item.Link).
-			Str("filename", item.Filename).
-			Int("attempt", item.RetryCount+1).
-			Msg("Retrying link")
-
-		download, err := s.rd.UnrestrictLink(item.Link)
-		if err != nil {
-			// Check if it's a retryable error (503)
-			if isRetryableError(err) {
-				s.retryQueue.IncrementRetry(item.Link)
-				stats.Failed++
-				s.logger.Debug().
-					Err(err).
-					Str("link", item.Link).
-					Msg("Retry failed, will try again next cycle")
-			} else {
-				// Non-retryable error, remove from queue
-				s.retryQueue.Remove(item.Link)
+		item := item // capture
+		pool.Submit(func() {
+			// Attempt to unrestrict the link
+			s.logger.Debug().
+				Str("link", item.Link).
+				Str("filename", item.Filename).
+				Int("attempt", item.RetryCount+1).
+				Msg("Retrying link")
+
+			download, err := s.rd.UnrestrictLink(item.Link)
+			if err != nil {
+				// Check if it's a retryable error (503)
+				if isRetryableError(err) {
+					s.retryQueue.IncrementRetry(item.Link)
+					s.logger.Debug().
+						Err(err).
+						Str("link", item.Link).
+						Msg("Retry failed, will try again next cycle")
+				} else {
+					// Non-retryable error, remove from queue
+					s.retryQueue.Remove(item.Link)
+					s.logger.Debug().
+						Err(err).
+						Str("link", item.Link).
+						Msg("Non-retryable error, removed from queue")
+				}
+				mu.Lock()
 				stats.Failed++
-				s.logger.Debug().
-					Err(err).
-					Str("link", item.Link).
-					Msg("Non-retryable error, removed from queue")
+				mu.Unlock()
+				return
 			}
-		} else {
+
 			// Success! Remove from queue
 			s.retryQueue.Remove(item.Link)
+			mu.Lock()
 			stats.Succeeded++
+			mu.Unlock()
 			s.logger.Info().
 				Str("filename", download.Filename).
 				Msg("Successfully retried link")
-		}
+		})
 	}
 
+	pool.Wait()
+
 	// Save queue state
 	if err := s.retryQueue.Save(); err != nil {
 		s.logger.Warn().Err(err).Msg("Failed to save retry queue")
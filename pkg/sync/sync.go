@@ -15,6 +15,7 @@ import (
 	"github.com/robofuse/robofuse/pkg/repair"
 	"github.com/robofuse/robofuse/pkg/retry"
 	"github.com/robofuse/robofuse/pkg/strm"
+	"github.com/robofuse/robofuse/pkg/tracking"
 	"github.com/robofuse/robofuse/pkg/worker"
 	"github.com/rs/zerolog"
 )
@@ -29,6 +30,8 @@ type Service struct {
 	retryQueue    *retry.Queue
 	config        *config.Config
 	logger        zerolog.Logger
+	organizer     *organizer.Organizer // created on first use
+	warmedUp      bool
 	// Reusable allocations for watch mode
 	downloadMap map[string]*realdebrid.Download
 	candidates  []realdebrid.STRMCandidate
@@ -81,6 +84,14 @@ func (s *Service) Run(dryRun bool) (*RunResult, error) {
 
 	s.logger.Debug().Msg("Starting sync...")
 
+	// Open the API connection once per process before the first real request
+	if !s.warmedUp {
+		s.warmedUp = true
+		if err := s.rd.Warmup(); err != nil {
+			s.logger.Warn().Err(err).Msg("API warmup failed")
+		}
+	}
+
 	// Step 1: Fetch all torrents
 	s.logger.Debug().Msg("Fetching torrents...")
 	downloaded, dead, err := s.rd.GetTorrents()
@@ -105,15 +116,13 @@ func (s *Service) Run(dryRun bool) (*RunResult, error) {
 	// Step 3: Repair dead torrents if enabled
 	if s.config.RepairTorrents && len(dead) > 0 {
 		s.logger.Debug().Int("count", len(dead)).Msg("Repairing dead torrents...")
-		repaired, _ := s.repairService.RepairTorrents(dead, dryRun)
-		result.TorrentsRepaired = repaired
+		repairedIDs, _ := s.repairService.RepairTorrents(dead, dryRun)
+		result.TorrentsRepaired = len(repairedIDs)
 
-		// Re-fetch torrents after repair
-		if repaired > 0 && !dryRun {
-			downloaded, _, err = s.rd.GetTorrents()
-			if err != nil {
-				s.logger.Warn().Err(err).Msg("Failed to re-fetch torrents after repair")
-			}
+		// Pick up repaired torrents that are already downloaded, with
+		// per-torrent lookups or a list refetch, whichever is fewer requests
+		if !dryRun {
+			downloaded = s.appendRepaired(downloaded, repairedIDs, result.TorrentsTotal)
 		}
 	}
 
@@ -133,20 +142,10 @@ func (s *Service) Run(dryRun bool) (*RunResult, error) {
 	}
 
 	// Step 5: Find links needing unrestriction
-	var missingLinks []missingLink
-	for _, torrent := range downloaded {
-		for _, link := range torrent.Links {
-			if _, exists := s.downloadMap[link]; !exists {
-				missingLinks = append(missingLinks, missingLink{
-					torrent: torrent,
-					link:    link,
-				})
-			}
-		}
-	}
+	missingLinks, totalLinks := collectMissingLinks(downloaded, s.downloadMap)
 
 	s.logger.Debug().
-		Int("total_torrent_links", countTotalLinks(downloaded)).
+		Int("total_torrent_links", totalLinks).
 		Int("existing_downloads", len(s.downloadMap)).
 		Int("missing", len(missingLinks)).
 		Msg("Link matching complete")
@@ -283,32 +282,51 @@ func (s *Service) refreshExpiringLinks(interval time.Duration) {
 
 	s.logger.Info().Int("count", len(expiredFiles)).Msg("Refreshing expired links")
 
+	var mu sync.Mutex
 	var refreshed, failed int
+	pool := worker.NewPool(s.config.ConcurrentRequests)
+
 	for _, tracking := range expiredFiles {
-		// Unrestrict the original link to get a fresh download URL
-		download, err := s.rd.UnrestrictLink(tracking.Link)
-		if err != nil {
-			s.logger.Warn().
-				Err(err).
-				Str("path", tracking.RelativePath).
-				Msg("Failed to refresh expired link")
-			failed++
-			continue
-		}
+		tracking := tracking // capture
+		pool.Submit(func() {
+			// Unrestrict the original link to get a fresh download URL
+			download, err := s.rd.UnrestrictLink(tracking.Link)
+			if err != nil {
+				s.logger.Warn().
+					Err(err).
+					Str("path", tracking.RelativePath).
+					Msg("Failed to refresh expired link")
+				mu.Lock()
+				failed++
+				mu.Unlock()
+				return
+			}
 
-		// Update the STRM file with the new URL
-		if err := s.strmService.UpdateSTRM(tracking.RelativePath, download.Download, tracking.Link, tracking.TorrentID); err != nil {
-			s.logger.Warn().
-				Err(err).
-				Str("path", tracking.RelativePath).
-				Msg("Failed to update STRM file")
-			failed++
-		} else {
+			// Update the STRM file with the new URL
+			if err := s.strmService.UpdateSTRM(tracking.RelativePath, download.Download, tracking.Link, tracking.TorrentID); err != nil {
+				s.logger.Warn().
+					Err(err).
+					Str("path", tracking.RelativePath).
+					Msg("Failed to update STRM file")
+				mu.Lock()
+				failed++
+				mu.Unlock()
+				return
+			}
+
+			mu.Lock()
 			refreshed++
-		}
+			mu.Unlock()
+		})
 	}
 
+	pool.Wait()
+
 	if refreshed > 0 {
+		if err := s.strmService.SaveTracking(); err != nil {
+			s.logger.Warn().Err(err).Msg("Failed to save tracking after refresh")
+		}
+
 		s.logger.Info().
 			Int("refreshed", refreshed).
 			Int("failed", failed).
@@ -330,10 +348,89 @@ func (s *Service) printCycleSummary(result *RunResult, interval time.Duration) {
 	}
 }
 
-// missingLink represents a link that needs unrestriction
+// appendRepaired adds repaired torrents that are already downloaded. Each one
+// is looked up on its own unless that would take more requests than listing
+// every torrent again, in which case the whole list is refetched. Torrents
+// still downloading are picked up by a later cycle's list.
+func (s *Service) appendRepaired(downloaded []*realdebrid.Torrent, repairedIDs []string, totalTorrents int) []*realdebrid.Torrent {
+	if len(repairedIDs) == 0 {
+		return downloaded
+	}
+
+	// The list has grown by the reinserted torrents
+	listPages := (totalTorrents + len(repairedIDs) + realdebrid.TorrentsPageSize - 1) / realdebrid.TorrentsPageSize
+	if len(repairedIDs) > listPages {
+		refetched, _, err := s.rd.GetTorrents()
+		if err != nil {
+			s.logger.Warn().Err(err).Msg("Failed to re-fetch torrents after repair")
+			return downloaded
+		}
+		return refetched
+	}
+
+	infos := make([]*realdebrid.TorrentInfo, len(repairedIDs))
+	pool := worker.NewPool(s.config.ConcurrentRequests)
+	for i, id := range repairedIDs {
+		i, id := i, id // capture for goroutine
+		pool.Submit(func() {
+			info, err := s.rd.GetTorrentInfo(id)
+			if err != nil {
+				s.logger.Warn().Err(err).Str("id", id).Msg("Failed to fetch repaired torrent")
+				return
+			}
+			infos[i] = info
+		})
+	}
+	pool.Wait()
+
+	for _, info := range infos {
+		if info == nil || info.Status != "downloaded" {
+			continue
+		}
+		torrent, err := info.ToTorrent()
+		if err != nil {
+			s.logger.Debug().Err(err).Str("id", info.ID).Msg("Repaired torrent has unparsable dates")
+		}
+		downloaded = append(downloaded, torrent)
+	}
+	return downloaded
+}
+
+// missingLink represents a link that needs unrestriction, with every torrent
+// that contains it
 type missingLink struct {
-	torrent *realdebrid.Torrent
-	link    string
+	torrents []*realdebrid.Torrent
+	link     string
+}
+
+// collectMissingLinks returns the links of torrents that have no download yet,
+// and the total number of torrent links. Each link is unrestricted once even
+// if several torrents share it; all of those torrents are kept on the entry.
+func collectMissingLinks(torrents []*realdebrid.Torrent, downloads map[string]*realdebrid.Download) ([]missingLink, int) {
+	var missing []missingLink
+	var index map[string]int // link -> position in missing
+	totalLinks := 0
+	for _, torrent := range torrents {
+		totalLinks += len(torrent.Links)
+		for _, link := range torrent.Links {
+			if _, exists := downloads[link]; exists {
+				continue
+			}
+			if index == nil {
+				index = make(map[string]int)
+			}
+			if i, queued := index[link]; queued {
+				missing[i].torrents = append(missing[i].torrents, torrent)
+				continue
+			}
+			index[link] = len(missing)
+			missing = append(missing, missingLink{
+				torrents: []*realdebrid.Torrent{torrent},
+				link:     link,
+			})
+		}
+	}
+	return missing, totalLinks
 }
 
 // unrestrictLinks unrestricts multiple links concurrently
@@ -362,37 +459,47 @@ func (s *Service) unrestrictLinks(links []missingLink, dryRun bool) ([]*realdebr
 		pool.Submit(func() {
 			download, err := s.rd.UnrestrictLink(ml.link)
 
-			mu.Lock()
-			defer mu.Unlock()
-
-			completed++
+			// Retry queue and logging do their own locking, keep them out of mu
+			retryable := false
 			if err != nil {
 				// Check if it's a retryable error (503, 502, 504)
 				if isRetryableError(err) {
-					// Add to retry queue for next cycle
-					s.addToRetryQueue(ml.link, ml.torrent, err)
-					queued++
-					s.logger.Debug().
-						Str("filename", ml.torrent.Filename).
-						Msg("Added to retry queue (retryable error)")
+					// Add to retry queue for next cycle. The queue is keyed by
+					// link, so one entry covers every torrent sharing it.
+					s.addToRetryQueue(ml.link, ml.torrents[0], err)
+					retryable = true
+					for _, torrent := range ml.torrents {
+						s.logger.Debug().
+							Str("filename", torrent.Filename).
+							Msg("Added to retry queue (retryable error)")
+					}
 				}
-
-				failed = append(failed, ml.link)
 				if !errors.Is(err, request.HosterUnavailableError) && !errors.Is(err, request.TrafficExceededError) {
 					s.logger.Debug().Err(err).Msg("Failed to unrestrict link")
 				}
+			}
+
+			mu.Lock()
+			completed++
+			if err != nil {
+				failed = append(failed, ml.link)
+				if retryable {
+					queued++
+				}
 			} else {
 				results = append(results, download)
 			}
+			done, succeeded, failedCount := completed, len(results), len(failed)
+			mu.Unlock()
 
 			if progress != nil {
-				progress.Update(completed)
-			} else if completed%100 == 0 || completed == len(links) {
+				progress.Update(done)
+			} else if done%100 == 0 || done == len(links) {
 				s.logger.Info().
-					Int("completed", completed).
+					Int("completed", done).
 					Int("total", len(links)).
-					Int("success", len(results)).
-					Int("failed", len(failed)).
+					Int("success", succeeded).
+					Int("failed", failedCount).
 					Msg("Unrestriction progress")
 			}
 		})
@@ -419,10 +526,17 @@ type candidateStats struct {
 // buildCandidatesInto builds STRM candidates from torrents and downloads, reusing the provided slice.
 func (s *Service) buildCandidatesInto(torrents []*realdebrid.Torrent, downloadMap map[string]*realdebrid.Download, candidates []realdebrid.STRMCandidate, stats *candidateStats) []realdebrid.STRMCandidate {
 	minSize := s.config.MinFileSizeBytes()
-	if stats != nil {
-		stats.Candidates = 0
-		stats.FilteredSmall = 0
-		stats.FilteredOther = 0
+	var filteredSmall, filteredOther int
+
+	// Grow once up front; every link can become at most one candidate
+	totalLinks := 0
+	for _, torrent := range torrents {
+		totalLinks += len(torrent.Links)
+	}
+	if cap(candidates)-len(candidates) < totalLinks {
+		grown := make([]realdebrid.STRMCandidate, len(candidates), len(candidates)+totalLinks)
+		copy(grown, candidates)
+		candidates = grown
 	}
 
 	for _, torrent := range torrents {
@@ -433,14 +547,11 @@ func (s *Service) buildCandidatesInto(torrents []*realdebrid.Torrent, downloadMa
 			}
 
 			// Check file type
-			isVid := isVideo(download.Filename)
-			isSub := isSubtitle(download.Filename)
+			isVid, isSub := classifyFile(download.Filename)
 
 			// Apply size filter ONLY to videos (not subtitles)
 			if isVid && download.Filesize < minSize {
-				if stats != nil {
-					stats.FilteredSmall++
-				}
+				filteredSmall++
 				s.logger.Debug().
 					Str("filename", download.Filename).
 					Int64("size_mb", download.Filesize/(1024*1024)).
@@ -451,9 +562,7 @@ func (s *Service) buildCandidatesInto(torrents []*realdebrid.Torrent, downloadMa
 
 			// Skip non-video, non-subtitle files
 			if !isVid && !isSub {
-				if stats != nil {
-					stats.FilteredOther++
-				}
+				filteredOther++
 				s.logger.Debug().
 					Str("filename", download.Filename).
 					Msg("Skipping non-video, non-subtitle file")
@@ -473,6 +582,8 @@ func (s *Service) buildCandidatesInto(torrents []*realdebrid.Torrent, downloadMa
 
 	if stats != nil {
 		stats.Candidates = len(candidates)
+		stats.FilteredSmall = filteredSmall
+		stats.FilteredOther = filteredOther
 	}
 	return candidates
 }
@@ -501,15 +612,6 @@ func (s *Service) findTorrentsForLinks(torrents []*realdebrid.Torrent, failedLin
 	return result
 }
 
-// countTotalLinks counts total links across all torrents
-func countTotalLinks(torrents []*realdebrid.Torrent) int {
-	count := 0
-	for _, t := range torrents {
-		count += len(t.Links)
-	}
-	return count
-}
-
 // OrganizerResult contains stats from the organizer.
 type OrganizerResult struct {
 	Processed int `json:"processed"`
@@ -524,16 +626,31 @@ type OrganizerResult struct {
 func (s *Service) runOrganizer() OrganizerResult {
 	s.logger.Debug().Msg("Running library organizer...")
 
-	org := organizer.New(organizer.Config{
-		BaseDir:      s.config.Path,
-		OrganizedDir: s.config.OrganizedDir,
-		OutputDir:    s.config.OutputDir,
-		TrackingFile: s.config.TrackingFile,
-		CacheDir:     s.config.CacheDir,
-		Logger:       s.logger,
+	// Keep one organizer for the life of the service so its parser and
+	// parse cache carry over between watch cycles
+	if s.organizer == nil {
+		s.organizer = organizer.New(organizer.Config{
+			BaseDir:      s.config.Path,
+			OrganizedDir: s.config.OrganizedDir,
+			OutputDir:    s.config.OutputDir,
+			TrackingFile: s.config.TrackingFile,
+			CacheDir:     s.config.CacheDir,
+			Logger:       s.logger,
+		})
+	}
+	org := s.organizer
+
+	// Hand over tracking from memory instead of re-reading the JSON file
+	entries := make(map[string]organizer.TrackingEntry)
+	s.strmService.ForEachTracked(func(relativePath string, t *tracking.FileTracking) {
+		entries[relativePath] = organizer.TrackingEntry{
+			Link:        t.Link,
+			DownloadURL: t.DownloadURL,
+			LastChecked: t.LastChecked.Format(time.RFC3339Nano),
+		}
 	})
 
-	result := org.Run()
+	result := org.RunWithTracking(entries)
 
 	s.logger.Debug().
 		Int("processed", result.Processed).
@@ -0,0 +1,73 @@
+package sync
+
+import (
+	"sort"
+	"testing"
+
+	"github.com/robofuse/robofuse/pkg/realdebrid"
+)
+
+// sync_test.go verifies link matching and file classification.
+
+func TestCollectMissingLinks_KeepsEveryTorrentOfASharedLink(t *testing.T) {
+	first := &realdebrid.Torrent{ID: "1", Filename: "first", Links: []string{"shared", "only-first", "have"}}
+	second := &realdebrid.Torrent{ID: "2", Filename: "second", Links: []string{"shared"}}
+	downloads := map[string]*realdebrid.Download{"have": {Link: "have"}}
+
+	missing, total := collectMissingLinks([]*realdebrid.Torrent{first, second}, downloads)
+
+	if total != 4 {
+		t.Fatalf("total links = %d, want 4", total)
+	}
+	if len(missing) != 2 {
+		t.Fatalf("got %d missing links, want 2 (shared links are queued once)", len(missing))
+	}
+	if missing[0].link != "shared" || len(missing[0].torrents) != 2 ||
+		missing[0].torrents[0] != first || missing[0].torrents[1] != second {
+		t.Fatalf("shared link entry = %+v, want both torrents in order", missing[0])
+	}
+	if missing[1].link != "only-first" || len(missing[1].torrents) != 1 {
+		t.Fatalf("second entry = %+v, want only-first with one torrent", missing[1])
+	}
+}
+
+func TestFindTorrentsForLinks_ReturnsEveryTorrentOfASharedLink(t *testing.T) {
+	torrents := []*realdebrid.Torrent{
+		{ID: "1", Links: []string{"shared"}},
+		{ID: "2", Links: []string{"other", "shared"}},
+		{ID: "3", Links: []string{"fine"}},
+	}
+
+	got := (&Service{}).findTorrentsForLinks(torrents, []string{"shared"})
+
+	ids := make([]string, 0, len(got))
+	for _, torrent := range got {
+		ids = append(ids, torrent.ID)
+	}
+	sort.Strings(ids)
+	if len(ids) != 2 || ids[0] != "1" || ids[1] != "2" {
+		t.Fatalf("repair targets = %v, want [1 2]", ids)
+	}
+}
+
+func TestClassifyFile(t *testing.T) {
+	cases := []struct {
+		name                string
+		isVideo, isSubtitle bool
+	}{
+		{"Movie.2024.mkv", true, false},
+		{"Movie.2024.MP4", true, false},
+		{"show/episode.m2ts", true, false},
+		{"Movie.2024.en.srt", false, true},
+		{"Movie.2024.IDX", false, true},
+		{"sample.nfo", false, false},
+		{"no-extension", false, false},
+		{"archive.mkv.rar", false, false},
+	}
+	for _, tc := range cases {
+		isVideo, isSubtitle := classifyFile(tc.name)
+		if isVideo != tc.isVideo || isSubtitle != tc.isSubtitle {
+			t.Errorf("classifyFile(%q) = %v, %v; want %v, %v", tc.name, isVideo, isSubtitle, tc.isVideo, tc.isSubtitle)
+		}
+	}
+}
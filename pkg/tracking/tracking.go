@@ -6,6 +6,7 @@ import (
 	"sync"
 	"time"
 
+	"github.com/robofuse/robofuse/internal/fileutil"
 	"github.com/robofuse/robofuse/internal/logger"
 	"github.com/rs/zerolog"
 )
@@ -26,6 +27,7 @@ type FileTracking struct {
 type Service struct {
 	trackingFile string
 	data         map[string]*FileTracking
+	dirty        bool // data changed since the last Load or Save
 	mu           sync.RWMutex
 	logger       zerolog.Logger
 }
@@ -52,6 +54,7 @@ func (s *Service) Track(relativePath, downloadURL, link, torrentID string) {
 	defer s.mu.Unlock()
 
 	now := time.Now()
+	s.dirty = true
 
 	if existing, exists := s.data[relativePath]; exists {
 		// Update existing entry
@@ -104,28 +107,44 @@ func (s *Service) Get(relativePath string) (*FileTracking, bool) {
 	return tracking, exists
 }
 
+// ForEach calls fn for every tracked file while holding the read lock.
+// fn must not call back into the Service.
+func (s *Service) ForEach(fn func(relativePath string, tracking *FileTracking)) {
+	s.mu.RLock()
+	defer s.mu.RUnlock()
+
+	for path, tracking := range s.data {
+		fn(path, tracking)
+	}
+}
+
 // Remove deletes tracking data for a file
 func (s *Service) Remove(relativePath string) {
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
-	delete(s.data, relativePath)
+	if _, exists := s.data[relativePath]; exists {
+		delete(s.data, relativePath)
+		s.dirty = true
+	}
 	s.logger.Debug().Str("path", relativePath).Msg("Removed tracking")
 }
 
-// Save persists tracking data to disk
+// Save persists tracking data to disk. It is a no-op when nothing changed
+// since the last Load or Save, so idle watch cycles don't rewrite the file.
 func (s *Service) Save() error {
-	s.mu.RLock()
-	defer s.mu.RUnlock()
+	s.mu.Lock()
+	defer s.mu.Unlock()
 
-	data, err := json.MarshalIndent(s.data, "", "  ")
-	if err != nil {
-		return err
+	if !s.dirty {
+		return nil
 	}
 
-	if err := os.WriteFile(s.trackingFile, data, 0644); err != nil {
+	// Compact JSON, written atomically so a crash never leaves a truncated file
+	if err := fileutil.WriteJSONAtomic(s.trackingFile, s.data, 0644); err != nil {
 		return err
 	}
+	s.dirty = false
 
 	s.logger.Debug().Int("count", len(s.data)).Msg("Saved tracking data")
 	return nil
@@ -144,6 +163,7 @@ func (s *Service) Load() error {
 	if err := json.Unmarshal(data, &s.data); err != nil {
 		return err
 	}
+	s.dirty = false
 
 	s.logger.Debug().Int("count", len(s.data)).Msg("Loaded tracking data")
 	return nil
@@ -1,13 +1,16 @@
 package tracking
 
 import (
+	"os"
+	"path/filepath"
 	"testing"
 	"time"
 
 	"github.com/robofuse/robofuse/internal/logger"
 )
 
-// tracking_test.go guards expiry behavior across CreatedAt/LastChecked values.
+// tracking_test.go guards expiry behavior across CreatedAt/LastChecked values
+// and skipped saves when nothing changed.
 
 func TestGetExpired_UsesLastCheckedFallbackCreatedAt(t *testing.T) {
 	now := time.Now()
@@ -46,3 +49,39 @@ func TestGetExpired_UsesLastCheckedFallbackCreatedAt(t *testing.T) {
 		t.Fatalf("expected never-checked to be expired based on CreatedAt")
 	}
 }
+
+func TestSave_SkipsWriteWhenUnchanged(t *testing.T) {
+	trackingFile := filepath.Join(t.TempDir(), "file_tracking.json")
+
+	svc := &Service{
+		trackingFile: trackingFile,
+		data:         make(map[string]*FileTracking),
+		logger:       logger.New("test"),
+	}
+
+	if err := svc.Save(); err != nil {
+		t.Fatalf("save: %v", err)
+	}
+	if _, err := os.Stat(trackingFile); !os.IsNotExist(err) {
+		t.Fatalf("expected no write for unchanged data")
+	}
+
+	svc.Track("Show/Episode.strm", "https://example.com/d/1", "https://real-debrid.com/d/ABC", "T1")
+	if err := svc.Save(); err != nil {
+		t.Fatalf("save: %v", err)
+	}
+	if _, err := os.Stat(trackingFile); err != nil {
+		t.Fatalf("expected tracking file after change: %v", err)
+	}
+
+	// A second save without changes must not rewrite the file.
+	if err := os.Remove(trackingFile); err != nil {
+		t.Fatalf("remove: %v", err)
+	}
+	if err := svc.Save(); err != nil {
+		t.Fatalf("save: %v", err)
+	}
+	if _, err := os.Stat(trackingFile); !os.IsNotExist(err) {
+		t.Fatalf("expected no rewrite without changes")
+	}
+}
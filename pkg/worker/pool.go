@@ -52,44 +52,31 @@ type Result[T any] struct {
 
 // BatchResult processes items in parallel and returns results
 type BatchResult[T any, R any] struct {
-	pool    *Pool
-	results chan Result[R]
-	wg      sync.WaitGroup
+	pool *Pool
 }
 
 // NewBatchProcessor creates a new batch processor
 func NewBatchProcessor[T any, R any](maxWorkers int) *BatchResult[T, R] {
 	return &BatchResult[T, R]{
-		pool:    NewPool(maxWorkers),
-		results: make(chan Result[R], 1000),
+		pool: NewPool(maxWorkers),
 	}
 }
 
-// Process processes items with the given function
+// Process processes items with the given function.
+// Results are returned in the same order as items.
 func (b *BatchResult[T, R]) Process(items []T, fn func(T) (R, error)) []Result[R] {
-	// Submit all jobs
-	for _, item := range items {
-		item := item // capture for goroutine
-		b.wg.Add(1)
+	// Each job writes its own slot, so no channel or lock is needed
+	results := make([]Result[R], len(items))
+
+	for i, item := range items {
+		i, item := i, item // capture for goroutine
 		b.pool.Submit(func() {
-			defer b.wg.Done()
 			result, err := fn(item)
-			b.results <- Result[R]{Value: result, Error: err}
+			results[i] = Result[R]{Value: result, Error: err}
 		})
 	}
 
-	// Wait and close results channel
-	go func() {
-		b.wg.Wait()
-		close(b.results)
-	}()
-
-	// Collect results
-	var results []Result[R]
-	for r := range b.results {
-		results = append(results, r)
-	}
-
+	b.pool.Wait()
 	return results
 }
 
@@ -0,0 +1,78 @@
+package worker
+
+import (
+	"errors"
+	"strconv"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+// pool_test.go verifies bounded concurrency and batch result ordering.
+
+func TestPool_BoundsConcurrency(t *testing.T) {
+	const workers = 3
+	pool := NewPool(workers)
+
+	var running, peak atomic.Int32
+	for i := 0; i < 20; i++ {
+		pool.Submit(func() {
+			n := running.Add(1)
+			for {
+				p := peak.Load()
+				if n <= p || peak.CompareAndSwap(p, n) {
+					break
+				}
+			}
+			time.Sleep(time.Millisecond)
+			running.Add(-1)
+		})
+	}
+	pool.Wait()
+
+	if got := peak.Load(); got > workers {
+		t.Fatalf("peak concurrency = %d, want at most %d", got, workers)
+	}
+}
+
+func TestBatchResult_ProcessKeepsOrderAndErrors(t *testing.T) {
+	items := make([]int, 50)
+	for i := range items {
+		items[i] = i
+	}
+	errOdd := errors.New("odd")
+
+	results := NewBatchProcessor[int, string](4).Process(items, func(n int) (string, error) {
+		// Later items finish first so completion order differs from input order
+		time.Sleep(time.Duration(len(items)-n) * 50 * time.Microsecond)
+		if n%2 == 1 {
+			return "", errOdd
+		}
+		return strconv.Itoa(n), nil
+	})
+
+	if len(results) != len(items) {
+		t.Fatalf("got %d results, want %d", len(results), len(items))
+	}
+	for i, r := range results {
+		if i%2 == 1 {
+			if !errors.Is(r.Error, errOdd) || r.Value != "" {
+				t.Fatalf("result %d = %+v, want the odd error", i, r)
+			}
+			continue
+		}
+		if r.Error != nil || r.Value != strconv.Itoa(i) {
+			t.Fatalf("result %d = %+v, want value %q", i, r, strconv.Itoa(i))
+		}
+	}
+}
+
+func TestBatchResult_ProcessEmpty(t *testing.T) {
+	results := NewBatchProcessor[int, int](2).Process(nil, func(n int) (int, error) {
+		t.Fatalf("fn called for an empty batch")
+		return 0, nil
+	})
+	if len(results) != 0 {
+		t.Fatalf("got %d results for an empty batch", len(results))
+	}
+}